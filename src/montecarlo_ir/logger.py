@@ -3,7 +3,9 @@
 import logging
 import sys
 
-logger: logging.Logger | None = None
+# Package logger; importing attaches no handlers, the first setup_logger call configures it
+logger: logging.Logger = logging.getLogger("montecarlo_ir")
+_configured: logging.Logger | None = None
 
 
 def setup_logger(
@@ -18,13 +20,15 @@ def setup_logger(
         level: Logging level. Defaults to logging.INFO.
         format_string: Custom format string. If None, uses default format.
 
+    Only the first call configures a logger; later calls return it as is.
+
     Returns:
         Configured logger instance.
     """
-    global logger
+    global _configured, logger
 
-    if logger is not None:
-        return logger
+    if _configured is not None:
+        return _configured
 
     if format_string is None:
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -33,20 +37,20 @@ def setup_logger(
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
 
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    logger.addHandler(handler)
+    configured = logging.getLogger(name)
+    configured.setLevel(level)
+    configured.addHandler(handler)
 
-    return logger
+    _configured = logger = configured
+    return configured
 
 
 def get_logger() -> logging.Logger:
-    """Get the package logger, creating it if necessary.
+    """Get the package logger, configuring it with defaults if necessary.
 
     Returns:
         Logger instance.
     """
-    global logger
-    if logger is None:
+    if _configured is None:
         return setup_logger()
-    return logger
+    return _configured
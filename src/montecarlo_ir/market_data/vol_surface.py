@@ -6,30 +6,65 @@ queries with interpolation/extrapolation. Prefers pure computations and immutabi
 
 from __future__ import annotations
 
-import bisect
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Literal
+from typing import Literal, overload
 
-from montecarlo_ir.utils.date_helpers import DayCountConvention, year_fraction
+import numpy as np
+
+from montecarlo_ir.market_data import _kernels
+from montecarlo_ir.utils.date_helpers import DayCountConvention, year_fraction, year_fractions
 
 InterpolationMethod = Literal["linear", "flat"]
 ExtrapolationMethod = Literal["flat", "linear"]
+VolatilityDtype = Literal["float64", "float32"]
+
+# Entry cap for the per-surface expiry time memo; a full memo is cleared rather than evicted
+_MAX_CACHE_SIZE = 10_000
+_QUERY_CACHE_SIZE = 1024
+
+
+def _validate_strictly_increasing(values: np.ndarray) -> None:
+    """Validate a strictly increasing numeric array."""
+    # Phrased as "all steps positive" so NaN steps fail too
+    if not np.all(np.diff(values) > 0.0):
+        raise ValueError("Values must be strictly increasing.")
+
+
+def _axis_weights(
+    grid: np.ndarray,
+    inv_gaps: np.ndarray,
+    x: np.ndarray,
+    flat_interp: bool,
+    linear_extrap: bool,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized bracket lookup along one surface axis.
+
+    Returns (lower index, upper index, weight on upper node) such that the value along
+    the axis is ``(1 - w) * y[lo] + w * y[hi]``, matching the scalar query semantics.
+    """
+    n = len(grid)
+    if n == 1:
+        zeros = np.zeros(x.shape, dtype=np.intp)
+        return zeros, zeros, np.zeros(x.shape)
 
+    lo = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, n - 2)
+    hi = lo + 1
+    if flat_interp:
+        # Flat interpolation picks the lower node; only flat extrapolation above the
+        # last node moves onto the upper one.
+        w = (x >= grid[-1]) if not linear_extrap else np.zeros(x.shape, dtype=bool)
+        return lo, hi, w.astype(np.float64)
 
-def _validate_strictly_increasing(values: list[float]) -> None:
-    """Validate a strictly increasing numeric sequence."""
-    for i in range(1, len(values)):
-        if not (values[i] > values[i - 1]):
-            raise ValueError("Values must be strictly increasing.")
+    w = (x - grid[lo]) * inv_gaps[lo]
+    if not linear_extrap:
+        w = np.clip(w, 0.0, 1.0)
+    return lo, hi, w
 
 
-def _linear_interpolate(x0: float, y0: float, x1: float, y1: float, x: float) -> float:
-    """Simple linear interpolation on y vs. x."""
-    if x1 == x0:
-        return y0
-    w = (x - x0) / (x1 - x0)
-    return (1.0 - w) * y0 + w * y1
+_INTERP_CODES = {"linear": _kernels.VOL_INTERP_LINEAR, "flat": _kernels.VOL_INTERP_FLAT}
+_EXTRAP_CODES = {"flat": _kernels.EXTRAP_FLAT, "linear": _kernels.EXTRAP_LINEAR}
+_DTYPES = {"float64": np.float64, "float32": np.float32}
 
 
 @dataclass(frozen=True)
@@ -51,6 +86,8 @@ class VolatilitySurface:
         interpolation: Interpolation method ('linear' or 'flat').
         extrapolation: Extrapolation method ('flat' or 'linear').
         day_count: Day count convention for time calculations.
+        dtype: Storage precision of the volatility matrix ('float64' or 'float32');
+            'float32' halves the memory read by batch queries.
     """
 
     valuation_date: date
@@ -60,17 +97,38 @@ class VolatilitySurface:
     interpolation: InterpolationMethod = "linear"
     extrapolation: ExtrapolationMethod = "flat"
     day_count: DayCountConvention = DayCountConvention.ACT_365
+    dtype: VolatilityDtype = "float64"
+
+    # Derived state, set in __post_init__
+    _exp_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    _ten_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    _vol: np.ndarray = field(init=False, repr=False, compare=False)
+    _exp_tuple: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _ten_tuple: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _vol_flat: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _interp_code: int = field(init=False, repr=False, compare=False)
+    _extrap_code: int = field(init=False, repr=False, compare=False)
+    _inv_exp_gaps: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _inv_ten_gaps: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _inv_exp_gaps_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    _inv_ten_gaps_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    _t_cache: dict[date, float] = field(init=False, repr=False, compare=False)
+    _query_cache: dict[tuple[float, float], float] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate surface data."""
+        if self.dtype not in _DTYPES:
+            raise ValueError(f"Unsupported dtype: {self.dtype}")
         if len(self.expiry_times) == 0:
             raise ValueError("At least one expiry time is required.")
         if len(self.tenor_times) == 0:
             raise ValueError("At least one tenor time is required.")
 
         # Validate strictly increasing times
-        _validate_strictly_increasing(list(self.expiry_times))
-        _validate_strictly_increasing(list(self.tenor_times))
+        exp_arr = np.asarray(self.expiry_times, dtype=np.float64)
+        ten_arr = np.asarray(self.tenor_times, dtype=np.float64)
+        _validate_strictly_increasing(exp_arr)
+        _validate_strictly_increasing(ten_arr)
 
         # Validate matrix dimensions
         if len(self.volatility_matrix) != len(self.expiry_times):
@@ -79,17 +137,57 @@ class VolatilitySurface:
                 f"got {len(self.volatility_matrix)}."
             )
 
-        for i, row in enumerate(self.volatility_matrix):
-            if len(row) != len(self.tenor_times):
-                raise ValueError(
-                    f"volatility_matrix row {i} must have {len(self.tenor_times)} columns (tenors), "
-                    f"got {len(row)}."
-                )
-
-            # Validate volatilities are positive
-            for j, vol in enumerate(row):
-                if vol < 0.0:
-                    raise ValueError(f"Volatility at [{i}][{j}] must be non-negative, got {vol}.")
+        # Dense row-major [expiry][tenor] storage: a corner pair shares one row
+        try:
+            vol = np.ascontiguousarray(self.volatility_matrix, dtype=_DTYPES[self.dtype])
+        except ValueError:
+            vol = None
+        if vol is None or vol.shape[1:] != (len(self.tenor_times),):
+            # Ragged or misshapen input: find the offending row for a specific message
+            for i, row in enumerate(self.volatility_matrix):
+                if len(row) != len(self.tenor_times):
+                    raise ValueError(
+                        f"volatility_matrix row {i} must have {len(self.tenor_times)} columns "
+                        f"(tenors), got {len(row)}."
+                    )
+            vol = np.ascontiguousarray(self.volatility_matrix, dtype=_DTYPES[self.dtype])
+
+        # Validate volatilities are positive
+        negative = np.argwhere(vol < 0.0)
+        if len(negative) > 0:
+            i, j = negative[0]
+            raise ValueError(f"Volatility at [{i}][{j}] must be non-negative, got {vol[i, j]}.")
+
+        # Cache array views of the grid for vectorized queries
+        object.__setattr__(self, "_exp_arr", exp_arr)
+        object.__setattr__(self, "_ten_arr", ten_arr)
+        object.__setattr__(self, "_vol", vol)
+
+        # Plain-float views and mode codes for the scalar kernel
+        if self.interpolation not in _INTERP_CODES:
+            raise ValueError(f"Unsupported interpolation method: {self.interpolation}")
+        if self.extrapolation not in _EXTRAP_CODES:
+            raise ValueError(f"Unsupported extrapolation method: {self.extrapolation}")
+        object.__setattr__(self, "_exp_tuple", tuple(self._exp_arr.tolist()))
+        object.__setattr__(self, "_ten_tuple", tuple(self._ten_arr.tolist()))
+        # Reciprocal node spacings along each axis
+        object.__setattr__(self, "_inv_exp_gaps", _kernels.inverse_gaps(self._exp_tuple))
+        object.__setattr__(self, "_inv_ten_gaps", _kernels.inverse_gaps(self._ten_tuple))
+        object.__setattr__(self, "_inv_exp_gaps_arr", np.asarray(self._inv_exp_gaps))
+        object.__setattr__(self, "_inv_ten_gaps_arr", np.asarray(self._inv_ten_gaps))
+        object.__setattr__(self, "_vol_flat", tuple(self._vol.ravel().tolist()))
+        object.__setattr__(self, "_interp_code", _INTERP_CODES[self.interpolation])
+        object.__setattr__(self, "_extrap_code", _EXTRAP_CODES[self.extrapolation])
+        # Memo of expiry times by date; the surface is immutable so entries never go stale
+        object.__setattr__(self, "_t_cache", {self.valuation_date: 0.0})
+        # Memo of scalar query results; Monte Carlo paths revisit the same (expiry, tenor) pairs
+        object.__setattr__(self, "_query_cache", {})
+
+    def invalidate_cache(self) -> None:
+        """Drop memoized expiry times and query results."""
+        self._t_cache.clear()
+        self._t_cache[self.valuation_date] = 0.0
+        self._query_cache.clear()
 
     def volatility(self, expiry_date: date, tenor_years: float) -> float:
         """Get volatility for given expiry date and tenor.
@@ -107,114 +205,133 @@ class VolatilitySurface:
         if expiry_date < self.valuation_date:
             raise ValueError("expiry_date must be on or after valuation_date.")
 
-        expiry_time = year_fraction(self.valuation_date, expiry_date, self.day_count)
+        cache = self._t_cache
+        expiry_time = cache.get(expiry_date)
+        if expiry_time is None:
+            expiry_time = year_fraction(self.valuation_date, expiry_date, self.day_count)
+            if len(cache) >= _MAX_CACHE_SIZE:
+                cache.clear()
+            cache[expiry_date] = expiry_time
         return self.volatility_at_times(expiry_time, tenor_years)
 
-    def volatility_at_times(self, expiry_time: float, tenor_time: float) -> float:
+    @overload
+    def volatility_at_times(self, expiry_time: float, tenor_time: float) -> float: ...
+
+    @overload
+    def volatility_at_times(
+        self, expiry_time: np.ndarray | list[float], tenor_time: float | np.ndarray | list[float]
+    ) -> np.ndarray: ...
+
+    @overload
+    def volatility_at_times(
+        self, expiry_time: float, tenor_time: np.ndarray | list[float]
+    ) -> np.ndarray: ...
+
+    def volatility_at_times(
+        self,
+        expiry_time: float | np.ndarray | list[float],
+        tenor_time: float | np.ndarray | list[float],
+    ) -> float | np.ndarray:
         """Get volatility for given expiry and tenor times.
 
+        Inputs with at least one dimension (arrays or lists) are dispatched to
+        `volatility_batch`.
+
         Args:
             expiry_time: Option expiry time in years from valuation_date.
             tenor_time: Underlying instrument tenor time in years.
 
         Returns:
-            Interpolated/extrapolated volatility.
+            Interpolated/extrapolated volatility, or array of volatilities for array inputs.
 
         Raises:
             ValueError: If times are negative.
         """
+        # Plain floats skip the dimension probe on the scalar hot path
+        if not (isinstance(expiry_time, float) and isinstance(tenor_time, float)):
+            if np.ndim(expiry_time) > 0 or np.ndim(tenor_time) > 0:
+                return self.volatility_batch(
+                    np.asarray(expiry_time, dtype=np.float64),
+                    np.asarray(tenor_time, dtype=np.float64),
+                )
+            # Ints and 0-d arrays are scalar queries; as floats they make hashable memo keys
+            expiry_time = float(np.asarray(expiry_time))
+            tenor_time = float(np.asarray(tenor_time))
+
+        # Only validated queries are stored, so a hit needs no further checks
+        cache = self._query_cache
+        key = (expiry_time, tenor_time)
+        vol = cache.get(key)
+        if vol is not None:
+            return vol
+
         if expiry_time < 0.0:
             raise ValueError("expiry_time must be non-negative.")
         if tenor_time < 0.0:
             raise ValueError("tenor_time must be non-negative.")
 
-        # Find indices for interpolation
-        exp_idx = self._find_index(self.expiry_times, expiry_time)
-        ten_idx = self._find_index(self.tenor_times, tenor_time)
-
-        # Get surrounding values
-        exp_low, exp_high = self._get_bounds(self.expiry_times, exp_idx)
-        ten_low, ten_high = self._get_bounds(self.tenor_times, ten_idx)
-
-        # Extract volatility values at corners
-        if exp_idx < 0:
-            # Below first expiry - extrapolate
-            vol_row_low = self.volatility_matrix[0]
-            vol_row_high = self.volatility_matrix[0] if len(self.expiry_times) == 1 else self.volatility_matrix[1]
-        elif exp_idx >= len(self.expiry_times) - 1:
-            # Above last expiry - extrapolate
-            if len(self.expiry_times) > 1 and self.extrapolation == "linear":
-                # Use last two rows for linear extrapolation
-                vol_row_low = self.volatility_matrix[-2]
-                vol_row_high = self.volatility_matrix[-1]
-            else:
-                # Flat extrapolation - use last row
-                vol_row_low = self.volatility_matrix[-1]
-                vol_row_high = self.volatility_matrix[-1]
-        else:
-            # Between expiries - interpolate
-            vol_row_low = self.volatility_matrix[exp_idx]
-            vol_row_high = self.volatility_matrix[exp_idx + 1]
-
-        # Interpolate/extrapolate in tenor dimension first
-        if ten_idx < 0:
-            # Below first tenor
-            vol_low = vol_row_low[0]
-            vol_high = vol_row_high[0]
-        elif ten_idx >= len(self.tenor_times) - 1:
-            # Above last tenor
-            vol_low = vol_row_low[-1]
-            vol_high = vol_row_high[-1]
-        else:
-            # Between tenors
-            vol_low = self._interpolate_1d(
-                ten_low, vol_row_low[ten_idx], ten_high, vol_row_low[ten_idx + 1], tenor_time
-            )
-            vol_high = self._interpolate_1d(
-                ten_low, vol_row_high[ten_idx], ten_high, vol_row_high[ten_idx + 1], tenor_time
-            )
+        vol = _kernels.vol_bilinear(
+            self._exp_tuple,
+            self._ten_tuple,
+            self._inv_exp_gaps,
+            self._inv_ten_gaps,
+            self._vol_flat,
+            expiry_time,
+            tenor_time,
+            self._interp_code,
+            self._extrap_code,
+        )
+        if len(cache) >= _QUERY_CACHE_SIZE:
+            cache.clear()
+        cache[key] = vol
+        return vol
+
+    def volatility_batch(
+        self, expiry_times: np.ndarray | list[float], tenor_times: np.ndarray | list[float]
+    ) -> np.ndarray:
+        """Get volatilities for arrays of expiry and tenor times in one vectorized pass.
 
-        # Interpolate/extrapolate in expiry dimension
-        return self._interpolate_1d(exp_low, vol_low, exp_high, vol_high, expiry_time)
-
-    def _find_index(self, times: tuple[float, ...], t: float) -> int:
-        """Find index for interpolation/extrapolation."""
-        if t <= times[0]:
-            return -1  # Below first
-        if t >= times[-1]:
-            return len(times) - 1  # At or above last
-        return bisect.bisect_right(times, t) - 1
-
-    def _get_bounds(self, times: tuple[float, ...], idx: int) -> tuple[float, float]:
-        """Get lower and upper bounds for interpolation."""
-        if idx < 0:
-            # Extrapolation below
-            if self.extrapolation == "flat":
-                return (times[0], times[0])
-            # Linear extrapolation
-            if len(times) > 1:
-                return (times[0], times[1])
-            return (times[0], times[0])
-
-        if idx >= len(times) - 1:
-            # Extrapolation above
-            if self.extrapolation == "flat":
-                return (times[-1], times[-1])
-            # Linear extrapolation
-            if len(times) > 1:
-                return (times[-2], times[-1])
-            return (times[-1], times[-1])
-
-        # Interpolation
-        return (times[idx], times[idx + 1])
-
-    def _interpolate_1d(
-        self, x0: float, y0: float, x1: float, y1: float, x: float
-    ) -> float:
-        """1D interpolation with flat or linear method."""
-        if self.interpolation == "flat":
-            return y0
-        return _linear_interpolate(x0, y0, x1, y1, x)
+        Args:
+            expiry_times: Option expiry times in years from valuation_date.
+            tenor_times: Underlying instrument tenor times in years. Broadcast against
+                expiry_times.
+
+        Returns:
+            Array of interpolated/extrapolated volatilities in the surface's storage dtype.
+
+        Raises:
+            ValueError: If any time is negative.
+        """
+        exp_q = np.asarray(expiry_times, dtype=np.float64)
+        ten_q = np.asarray(tenor_times, dtype=np.float64)
+        exp_q, ten_q = np.broadcast_arrays(exp_q, ten_q)
+        if np.any(exp_q < 0.0):
+            raise ValueError("expiry_time must be non-negative.")
+        if np.any(ten_q < 0.0):
+            raise ValueError("tenor_time must be non-negative.")
+
+        flat_interp = self._interp_code == _kernels.VOL_INTERP_FLAT
+        ei0, ei1, we = _axis_weights(
+            self._exp_arr,
+            self._inv_exp_gaps_arr,
+            exp_q,
+            flat_interp,
+            self._extrap_code == _kernels.EXTRAP_LINEAR,
+        )
+        # The tenor axis is always extrapolated flat
+        ti0, ti1, wt = _axis_weights(
+            self._ten_arr, self._inv_ten_gaps_arr, ten_q, flat_interp, False
+        )
+
+        # Gather corners from the flattened matrix with row offsets
+        vol = self._vol
+        flat = vol.ravel()
+        row_low = ei0 * vol.shape[1]
+        row_high = ei1 * vol.shape[1]
+        vol_low = (1.0 - wt) * flat[row_low + ti0] + wt * flat[row_low + ti1]
+        vol_high = (1.0 - wt) * flat[row_high + ti0] + wt * flat[row_high + ti1]
+        vols: np.ndarray = ((1.0 - we) * vol_low + we * vol_high).astype(vol.dtype, copy=False)
+        return vols
 
 
 def build_volatility_surface_from_matrix(
@@ -226,6 +343,7 @@ def build_volatility_surface_from_matrix(
     day_count: DayCountConvention = DayCountConvention.ACT_365,
     interpolation: InterpolationMethod = "linear",
     extrapolation: ExtrapolationMethod = "flat",
+    dtype: VolatilityDtype = "float64",
 ) -> VolatilitySurface:
     """Build volatility surface from expiry dates, tenor years, and volatility matrix.
 
@@ -237,6 +355,7 @@ def build_volatility_surface_from_matrix(
         day_count: Day count convention for time calculations.
         interpolation: Interpolation method.
         extrapolation: Extrapolation method.
+        dtype: Storage precision of the volatility matrix.
 
     Returns:
         VolatilitySurface instance.
@@ -245,9 +364,7 @@ def build_volatility_surface_from_matrix(
         ValueError: If inputs are invalid.
     """
     # Convert expiry dates to times
-    expiry_times = tuple(
-        year_fraction(valuation_date, d, day_count) for d in expiry_dates
-    )
+    expiry_times = tuple(year_fractions(valuation_date, expiry_dates, day_count).tolist())
 
     # Validate and convert inputs
     tenor_times = tuple(float(t) for t in tenor_years)
@@ -261,5 +378,6 @@ def build_volatility_surface_from_matrix(
         interpolation=interpolation,
         extrapolation=extrapolation,
         day_count=day_count,
+        dtype=dtype,
     )
 
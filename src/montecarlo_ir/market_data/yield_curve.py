@@ -6,17 +6,41 @@ with simple interpolation choices. Prefers pure computations and immutability.
 
 from __future__ import annotations
 
-import bisect
 import math
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Literal
 
-from montecarlo_ir.utils.date_helpers import DayCountConvention, year_fraction
+import numpy as np
+
+from montecarlo_ir.market_data import _kernels
+from montecarlo_ir.utils.date_helpers import DayCountConvention, year_fraction, year_fractions
 
 InterpolationMethod = Literal["linear_zero", "log_linear_df"]
 CompoundingMethod = Literal["cont", "simple", "annual"]
 
+_INTERP_CODES = {
+    "linear_zero": _kernels.INTERP_LINEAR_ZERO,
+    "log_linear_df": _kernels.INTERP_LOG_LINEAR_DF,
+}
+_COMP_CODES = {
+    "cont": _kernels.COMP_CONT,
+    "annual": _kernels.COMP_ANNUAL,
+    "simple": _kernels.COMP_SIMPLE,
+}
+# Entry cap for the per-curve memos; a full memo is cleared rather than evicted
+_MAX_CACHE_SIZE = 10_000
+# Memo of swap-bootstrapped curves by their inputs, cleared when full
+_SWAP_CURVE_CACHE_SIZE = 64
+_SWAP_CURVE_CACHE: dict[tuple, YieldCurve] = {}
+# Day counts that reduce to an actual-day difference over a fixed denominator
+_ACT_DENOMINATORS = {
+    DayCountConvention.ACT_360: 360.0,
+    DayCountConvention.ACT_365: 365.0,
+    DayCountConvention.ACT_365_25: 365.25,
+}
+
 
 def _validate_strictly_increasing(values: list[float]) -> None:
     """Validate a strictly increasing numeric sequence."""
@@ -25,12 +49,77 @@ def _validate_strictly_increasing(values: list[float]) -> None:
             raise ValueError("Values must be strictly increasing.")
 
 
-def _linear_interpolate(x0: float, y0: float, x1: float, y1: float, x: float) -> float:
-    """Simple linear interpolation on y vs. x."""
-    if x1 == x0:
-        return y0
-    w = (x - x0) / (x1 - x0)
-    return (1.0 - w) * y0 + w * y1
+def _comp_code_for(compounding: CompoundingMethod) -> int:
+    """Validate a compounding method and return its kernel mode code."""
+    if compounding not in _COMP_CODES:
+        raise ValueError(f"Unsupported compounding method: {compounding}")
+    return _COMP_CODES[compounding]
+
+
+def _log_dfs_from_rates(r: np.ndarray, t: np.ndarray, comp_code: int) -> np.ndarray:
+    """Vectorized counterpart of `_kernels.log_df_from_rate`."""
+    log_dfs: np.ndarray
+    if comp_code == _kernels.COMP_CONT:
+        log_dfs = -r * t
+    elif comp_code == _kernels.COMP_ANNUAL:
+        log_dfs = -t * np.log1p(r)
+    else:
+        log_dfs = -np.log1p(r * t)
+    return log_dfs
+
+
+def _rates_from_log_dfs(log_df: np.ndarray, t: np.ndarray, comp_code: int) -> np.ndarray:
+    """Vectorized counterpart of `_kernels.rate_from_log_df`."""
+    rates: np.ndarray
+    if comp_code == _kernels.COMP_CONT:
+        rates = -log_df / t
+    elif comp_code == _kernels.COMP_ANNUAL:
+        rates = np.expm1(-log_df / t)
+    else:
+        rates = np.expm1(-log_df) / t
+    return rates
+
+
+def _zero_rates_at_times(
+    times: np.ndarray,
+    zeros: np.ndarray,
+    log_dfs: np.ndarray,
+    ts: np.ndarray,
+    interp_code: int,
+    comp_code: int,
+) -> np.ndarray:
+    """Vectorized counterpart of `_kernels.zero_rate_at`."""
+    if interp_code == _kernels.INTERP_LINEAR_ZERO:
+        # np.interp holds the end values flat, matching the curve's extrapolation
+        zero_rates: np.ndarray = np.interp(ts, times, zeros)
+        return zero_rates
+
+    # interpolate log DF linearly, then convert back to zero rate
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = _rates_from_log_dfs(np.interp(ts, times, log_dfs), ts, comp_code)
+    # Exact match or out-of-bounds
+    rates = np.where(ts >= times[-1], zeros[-1], rates)
+    return np.where(ts <= times[0], zeros[0], rates)
+
+
+def _log_dfs_at_times(
+    times: np.ndarray,
+    zeros: np.ndarray,
+    log_dfs: np.ndarray,
+    ts: np.ndarray,
+    interp_code: int,
+    comp_code: int,
+) -> np.ndarray:
+    """Vectorized counterpart of `_kernels.log_discount_factor_at`."""
+    if interp_code == _kernels.INTERP_LINEAR_ZERO:
+        return _log_dfs_from_rates(np.interp(ts, times, zeros), ts, comp_code)
+
+    # Interpolated log DFs are used as-is inside the pillar range; outside it the
+    # zero rate is extrapolated flat
+    edge_rates = np.where(ts <= times[0], zeros[0], zeros[-1])
+    edge_log_dfs = _log_dfs_from_rates(edge_rates, ts, comp_code)
+    inside = (ts > times[0]) & (ts < times[-1])
+    return np.where(inside, np.interp(ts, times, log_dfs), edge_log_dfs)
 
 
 @dataclass(frozen=True)
@@ -55,6 +144,19 @@ class YieldCurve:
     interpolation: InterpolationMethod = "log_linear_df"
     compounding: CompoundingMethod = "cont"
 
+    # Derived state, set in __post_init__
+    _pillar_times: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _times_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    _zeros_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    _log_df_pillars: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _log_df_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    _interp_code: int = field(init=False, repr=False, compare=False)
+    _comp_code: int = field(init=False, repr=False, compare=False)
+    _df_cache: dict[date, float] = field(init=False, repr=False, compare=False)
+    _t_cache: dict[date, float] = field(init=False, repr=False, compare=False)
+    _log_df_knots: tuple[np.ndarray, np.ndarray] | None = field(init=False, repr=False, compare=False)
+    _slopes: tuple[float, ...] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         if len(self.pillar_dates) != len(self.pillar_zero_rates):
             raise ValueError("pillar_dates and pillar_zero_rates must have the same length.")
@@ -63,32 +165,99 @@ class YieldCurve:
         if any(d < self.valuation_date for d in self.pillar_dates):
             raise ValueError("All pillar_dates must be on or after valuation_date.")
 
-        # Ensure strictly increasing pillar_dates
-        sorted_pairs = sorted(zip(self.pillar_dates, self.pillar_zero_rates), key=lambda x: x[0])
-        dates_sorted = [d for d, _ in sorted_pairs]
-        _validate_strictly_increasing([d.toordinal() for d in dates_sorted])
+        # Ensure strictly increasing pillar_dates. Builders pass pillars in order, so
+        # only sort when a single scan finds them out of order.
+        dates_sorted = tuple(self.pillar_dates)
+        rates_sorted = tuple(self.pillar_zero_rates)
+        if not all(d0 < d1 for d0, d1 in zip(dates_sorted, dates_sorted[1:])):
+            sorted_pairs = sorted(zip(dates_sorted, rates_sorted), key=lambda x: x[0])
+            dates_sorted = tuple(d for d, _ in sorted_pairs)
+            rates_sorted = tuple(r for _, r in sorted_pairs)
+            _validate_strictly_increasing([d.toordinal() for d in dates_sorted])
 
         # Compute strictly increasing times from valuation_date
-        times = [
-            year_fraction(self.valuation_date, d, self.day_count) for d in dates_sorted
-        ]
+        times = year_fractions(self.valuation_date, dates_sorted, self.day_count).tolist()
         _validate_strictly_increasing(times)
 
         # Freeze canonical sorted data in object state
-        object.__setattr__(self, "pillar_dates", tuple(dates_sorted))
-        object.__setattr__(self, "pillar_zero_rates", tuple(r for _, r in sorted_pairs))
+        object.__setattr__(self, "pillar_dates", dates_sorted)
+        object.__setattr__(self, "pillar_zero_rates", rates_sorted)
         object.__setattr__(self, "_pillar_times", tuple(times))  # years
+        # Array views of the pillars for vectorized queries
+        times_arr = np.asarray(times, dtype=np.float64)
+        times_arr.flags.writeable = False
+        object.__setattr__(self, "_times_arr", times_arr)
+        object.__setattr__(
+            self, "_zeros_arr", np.asarray(self.pillar_zero_rates, dtype=np.float64)
+        )
+        # Mode codes for the scalar and vectorized kernels
+        if self.interpolation not in _INTERP_CODES:
+            raise ValueError(f"Unsupported interpolation method: {self.interpolation}")
+        object.__setattr__(self, "_interp_code", _INTERP_CODES[self.interpolation])
+        object.__setattr__(self, "_comp_code", _comp_code_for(self.compounding))
+        # Pillar log discount factors, fixed for the life of the curve
+        log_dfs = _log_dfs_from_rates(self._zeros_arr, self._times_arr, self._comp_code)
+        object.__setattr__(self, "_log_df_pillars", tuple(log_dfs.tolist()))
+        object.__setattr__(self, "_log_df_arr", log_dfs)
+        # Slopes between pillars of the interpolated quantity, so a scalar query is a
+        # single multiply-add from the lower pillar
+        node_values = (
+            self.pillar_zero_rates
+            if self._interp_code == _kernels.INTERP_LINEAR_ZERO
+            else self._log_df_pillars
+        )
+        object.__setattr__(self, "_slopes", _kernels.node_slopes(times, node_values))
+        # Log-linear DFs with continuous compounding: the flat zero extrapolation is
+        # linear in t too (log DF = -z * t), so knots with the origin prepended cover
+        # the whole curve in a single np.interp, given a far node on the last slope.
+        # The far node is placed once at twice the last pillar time; queries beyond
+        # it get a node built per call.
+        knots = None
+        if self._interp_code == _kernels.INTERP_LOG_LINEAR_DF and (
+            self._comp_code == _kernels.COMP_CONT
+        ):
+            t_far = 2.0 * times[-1] + 1.0
+            origin = [] if times[0] == 0.0 else [0.0]
+            knots = (
+                np.array(origin + times + [t_far]),
+                np.concatenate((origin, log_dfs, [-rates_sorted[-1] * t_far])),
+            )
+        object.__setattr__(self, "_log_df_knots", knots)
+        # Memos of discount factors and times by date; the curve is immutable so
+        # entries never go stale. Times are seeded with the pillars.
+        object.__setattr__(self, "_df_cache", {})
+        t_cache = dict(zip(dates_sorted, times))
+        t_cache[self.valuation_date] = 0.0
+        object.__setattr__(self, "_t_cache", t_cache)
 
     # -------- Public API --------
+    @property
+    def pillar_year_fractions(self) -> np.ndarray:
+        """Read-only year fractions from valuation_date to each pillar date."""
+        return self._times_arr
+
     def discount_factor(self, target_date: date) -> float:
         """Compute discount factor to a target date."""
+        cache = self._df_cache
+        df = cache.get(target_date)
+        if df is not None:
+            return df
         if target_date < self.valuation_date:
             raise ValueError("target_date must be on or after valuation_date.")
         t = self._time_from_valuation(target_date)
-        if t == 0.0:
-            return 1.0
-        r = self._zero_rate_at_time(t)
-        return self._df_from_rate(r, t)
+        df = _kernels.discount_factor_at(
+            self._pillar_times,
+            self.pillar_zero_rates,
+            self._log_df_pillars,
+            self._slopes,
+            t,
+            self._interp_code,
+            self._comp_code,
+        )
+        if len(cache) >= _MAX_CACHE_SIZE:
+            cache.clear()
+        cache[target_date] = df
+        return df
 
     def zero_rate(self, target_date: date) -> float:
         """Compute zero rate to a target date (consistent with curve interpolation)."""
@@ -100,71 +269,203 @@ class YieldCurve:
             return self.pillar_zero_rates[0]
         return self._zero_rate_at_time(t)
 
+    def discount_factor_many(self, dates: list[date] | tuple[date, ...]) -> np.ndarray:
+        """Compute discount factors for a sequence of dates, reusing memoized values.
+
+        Dates not seen before are evaluated together in one vectorized pass and added
+        to the memo, so repeated coupon schedules are priced from the cache.
+        """
+        cache = self._df_cache
+        cached = cache.get
+        valuation_date = self.valuation_date
+        out = np.empty(len(dates))
+        missing: dict[date, list[int]] = {}
+        for i, d in enumerate(dates):
+            df = cached(d)
+            if df is None:
+                if d < valuation_date:
+                    raise ValueError("target_date must be on or after valuation_date.")
+                missing.setdefault(d, []).append(i)
+            else:
+                out[i] = df
+        if missing:
+            new_dates = list(missing)
+            time_from_valuation = self._time_from_valuation
+            ts = np.array([time_from_valuation(d) for d in new_dates])
+            if len(cache) + len(new_dates) > _MAX_CACHE_SIZE:
+                cache.clear()
+            for d, df in zip(new_dates, self.discount_factor_batch(ts).tolist()):
+                cache[d] = df
+                out[missing[d]] = df
+        return out
+
+    def zero_rate_many(self, dates: list[date] | tuple[date, ...]) -> np.ndarray:
+        """Compute zero rates for a sequence of dates in one vectorized pass."""
+        if len(dates) > 0 and min(dates) < self.valuation_date:
+            raise ValueError("target_date must be on or after valuation_date.")
+        return self.zero_rate_at_times(year_fractions(self.valuation_date, dates, self.day_count))
+
+    def discount_factor_batch(self, ts: np.ndarray | list[float]) -> np.ndarray:
+        """Compute discount factors for an array of times (years from valuation_date)."""
+        return np.exp(self._log_dfs_at_times(np.asarray(ts, dtype=np.float64)))
+
+    def zero_rate_at_times(self, ts: np.ndarray | list[float]) -> np.ndarray:
+        """Compute zero rates for an array of times (years from valuation_date).
+
+        Zero rates are flat-extrapolated outside the pillar range; a zero-maturity
+        query returns the first pillar's rate.
+        """
+        ts_arr = np.asarray(ts, dtype=np.float64)
+        if np.any(ts_arr < 0.0):
+            raise ValueError("Times must be non-negative.")
+
+        return _zero_rates_at_times(
+            self._times_arr,
+            self._zeros_arr,
+            self._log_df_arr,
+            ts_arr,
+            self._interp_code,
+            self._comp_code,
+        )
+
     def forward_rate(self, start_date: date, end_date: date) -> float:
         """Compute simple forward rate between two dates."""
         if end_date <= start_date:
             raise ValueError("end_date must be after start_date.")
-        df_start = self.discount_factor(start_date)
-        df_end = self.discount_factor(end_date)
+        if start_date < self.valuation_date:
+            raise ValueError("target_date must be on or after valuation_date.")
+        log_df_start = self._log_df_at_time(self._time_from_valuation(start_date))
+        log_df_end = self._log_df_at_time(self._time_from_valuation(end_date))
         tau = year_fraction(start_date, end_date, self.day_count)
-        # Return simple forward rate over the period
-        return (df_start / df_end - 1.0) / tau
+        # Return simple forward rate over the period: (DF(start) / DF(end) - 1) / tau
+        return math.expm1(log_df_start - log_df_end) / tau
+
+    def discount_factor_t(self, t: float) -> float:
+        """Compute discount factor at time t (years from valuation_date)."""
+        if t < 0.0:
+            raise ValueError("Times must be non-negative.")
+        return _kernels.discount_factor_at(
+            self._pillar_times,
+            self.pillar_zero_rates,
+            self._log_df_pillars,
+            self._slopes,
+            t,
+            self._interp_code,
+            self._comp_code,
+        )
 
-    # -------- Internal helpers --------
-    def _time_from_valuation(self, d: date) -> float:
-        return year_fraction(self.valuation_date, d, self.day_count)
-
-    def _df_from_rate(self, r: float, t: float) -> float:
-        if self.compounding == "cont":
-            return math.exp(-r * t)
-        if self.compounding == "annual":
-            return 1.0 / ((1.0 + r) ** t)
-        if self.compounding == "simple":
-            return 1.0 / (1.0 + r * t)
-        raise ValueError(f"Unsupported compounding method: {self.compounding}")
-
-    def _rate_from_df(self, df: float, t: float) -> float:
-        if t == 0.0:
-            return self.pillar_zero_rates[0]
-        if self.compounding == "cont":
-            return -math.log(df) / t
-        if self.compounding == "annual":
-            return (df ** (-1.0 / t)) - 1.0
-        if self.compounding == "simple":
-            return (1.0 / df - 1.0) / t
-        raise ValueError(f"Unsupported compounding method: {self.compounding}")
+    def zero_rate_t(self, t: float) -> float:
+        """Compute zero rate at time t (years from valuation_date)."""
+        if t < 0.0:
+            raise ValueError("Times must be non-negative.")
+        return self._zero_rate_at_time(t)
 
-    def _zero_rate_at_time(self, t: float) -> float:
-        times = self._pillar_times
-        zeros = self.pillar_zero_rates
+    def forward_rate_t(self, start_time: float, end_time: float) -> float:
+        """Compute simple forward rate between two times (years from valuation_date).
+
+        The accrual period is taken as ``end_time - start_time``.
+        """
+        if end_time <= start_time:
+            raise ValueError("end_time must be after start_time.")
+        if start_time < 0.0:
+            raise ValueError("Times must be non-negative.")
+        log_df_start = self._log_df_at_time(start_time)
+        log_df_end = self._log_df_at_time(end_time)
+        return math.expm1(log_df_start - log_df_end) / (end_time - start_time)
+
+    def forward_rate_batch(
+        self, start_times: np.ndarray | list[float], end_times: np.ndarray | list[float]
+    ) -> np.ndarray:
+        """Compute simple forward rates for arrays of period start and end times.
+
+        Times are in years from valuation_date and the accrual period is taken as
+        ``end_times - start_times``. Both ends are interpolated in a single pass.
+        """
+        starts = np.asarray(start_times, dtype=np.float64)
+        ends = np.asarray(end_times, dtype=np.float64)
+        starts, ends = np.broadcast_arrays(starts, ends)
+        if np.any(ends <= starts):
+            raise ValueError("end_time must be after start_time.")
+
+        ts = np.concatenate([starts.ravel(), ends.ravel()])
+        log_dfs = self._log_dfs_at_times(ts)
+        n = starts.size
+        log_df_start = log_dfs[:n].reshape(starts.shape)
+        log_df_end = log_dfs[n:].reshape(ends.shape)
+        forwards: np.ndarray = np.expm1(log_df_start - log_df_end) / (ends - starts)
+        return forwards
 
-        # Exact match or out-of-bounds
-        if t <= times[0]:
-            return zeros[0]
-        if t >= times[-1]:
-            return zeros[-1]
+    # -------- Internal helpers --------
+    def _time_from_valuation(self, d: date) -> float:
+        cache = self._t_cache
+        t = cache.get(d)
+        if t is None:
+            t = year_fraction(self.valuation_date, d, self.day_count)
+            if len(cache) >= _MAX_CACHE_SIZE:
+                cache.clear()
+            cache[d] = t
+        return t
+
+    def _log_dfs_at_times(self, ts: np.ndarray) -> np.ndarray:
+        if np.any(ts < 0.0):
+            raise ValueError("Times must be non-negative.")
+        knots = self._log_df_knots
+        if knots is not None and ts.size:
+            knot_times, knot_log_dfs = knots
+            t_max = float(ts.max())
+            log_dfs: np.ndarray
+            if t_max < knot_times[-1]:
+                log_dfs = np.interp(ts, knot_times, knot_log_dfs)
+            else:
+                t_far = t_max + 1.0
+                log_dfs = np.interp(
+                    ts,
+                    np.append(knot_times[:-1], t_far),
+                    np.append(knot_log_dfs[:-1], -self._zeros_arr[-1] * t_far),
+                )
+            return log_dfs
+        return _log_dfs_at_times(
+            self._times_arr,
+            self._zeros_arr,
+            self._log_df_arr,
+            ts,
+            self._interp_code,
+            self._comp_code,
+        )
 
-        idx = bisect.bisect_right(times, t)
-        t0, t1 = times[idx - 1], times[idx]
-        z0, z1 = zeros[idx - 1], zeros[idx]
+    def _log_df_at_time(self, t: float) -> float:
+        return _kernels.log_discount_factor_at(
+            self._pillar_times,
+            self.pillar_zero_rates,
+            self._log_df_pillars,
+            self._slopes,
+            t,
+            self._interp_code,
+            self._comp_code,
+        )
 
-        if self.interpolation == "linear_zero":
-            return _linear_interpolate(t0, z0, t1, z1, t)
+    def _zero_rate_at_time(self, t: float) -> float:
+        return _kernels.zero_rate_at(
+            self._pillar_times,
+            self.pillar_zero_rates,
+            self._log_df_pillars,
+            self._slopes,
+            t,
+            self._interp_code,
+            self._comp_code,
+        )
 
-        if self.interpolation == "log_linear_df":
-            # interpolate log DF linearly, then convert back to zero rate
-            df0 = self._df_from_rate(z0, t0)
-            df1 = self._df_from_rate(z1, t1)
-            log_df0 = math.log(df0)
-            log_df1 = math.log(df1)
-            log_df_t = _linear_interpolate(t0, log_df0, t1, log_df1, t)
-            df_t = math.exp(log_df_t)
-            return self._rate_from_df(df_t, t)
 
-        raise ValueError(f"Unsupported interpolation method: {self.interpolation}")
+# --------- Bootstrapping helpers (simple) ---------
+def _zero_from_df(df: float, t: float, comp_code: int) -> float:
+    """Convert a discount factor over t > 0 years to a zero rate."""
+    if comp_code == _kernels.COMP_CONT:
+        return -math.log(df) / t
+    if comp_code == _kernels.COMP_ANNUAL:
+        return float(df ** (-1.0 / t)) - 1.0
+    return (1.0 / df - 1.0) / t
 
 
-# --------- Bootstrapping helpers (simple) ---------
 def build_yield_curve_from_discount_factors(
     valuation_date: date,
     pillar_dates: list[date] | tuple[date, ...],
@@ -177,23 +478,16 @@ def build_yield_curve_from_discount_factors(
     """Create YieldCurve from discount factors by converting to zero rates."""
     if len(pillar_dates) != len(discount_factors):
         raise ValueError("pillar_dates and discount_factors must have the same length.")
+    comp_code = _comp_code_for(compounding)
     zeros: list[float] = []
-    for d, df in zip(pillar_dates, discount_factors):
-        t = year_fraction(valuation_date, d, day_count)
+    times = year_fractions(valuation_date, pillar_dates, day_count).tolist()
+    for t, df in zip(times, discount_factors):
         if t <= 0.0:
             raise ValueError("All pillar dates must be after valuation_date.")
         if df <= 0.0 or df >= 1.0 + 1e-12:
             raise ValueError("Discount factors must be in (0, 1].")
         # Convert DF to zero consistent with compounding
-        if compounding == "cont":
-            z = -math.log(df) / t
-        elif compounding == "annual":
-            z = df ** (-1.0 / t) - 1.0
-        elif compounding == "simple":
-            z = (1.0 / df - 1.0) / t
-        else:
-            raise ValueError(f"Unsupported compounding method: {compounding}")
-        zeros.append(z)
+        zeros.append(_zero_from_df(df, t, comp_code))
     return YieldCurve(
         valuation_date=valuation_date,
         pillar_dates=tuple(pillar_dates),
@@ -237,17 +531,22 @@ def build_yield_curve_from_deposits_simple(
     DF = 1 / (1 + r * T), then convert to zero consistent with chosen compounding."""
     if len(deposit_maturities) != len(deposit_simple_rates):
         raise ValueError("deposit_maturities and deposit_simple_rates must have the same length.")
-    dfs: list[float] = []
-    for d, r in zip(deposit_maturities, deposit_simple_rates):
-        t = year_fraction(valuation_date, d, day_count)
+    comp_code = _comp_code_for(compounding)
+    zeros: list[float] = []
+    times = year_fractions(valuation_date, deposit_maturities, day_count).tolist()
+    for t, r in zip(times, deposit_simple_rates):
         if t <= 0.0:
             raise ValueError("All deposit maturities must be after valuation_date.")
         df = 1.0 / (1.0 + r * t)
-        dfs.append(df)
-    return build_yield_curve_from_discount_factors(
+        if df <= 0.0 or df >= 1.0 + 1e-12:
+            raise ValueError("Discount factors must be in (0, 1].")
+        # Convert via log DF = -log1p(r * t) rather than the rounded DF, which keeps
+        # full precision for short deposits where r * t is tiny
+        zeros.append(_kernels.rate_from_log_df(-math.log1p(r * t), t, comp_code))
+    return YieldCurve(
         valuation_date=valuation_date,
         pillar_dates=tuple(deposit_maturities),
-        discount_factors=tuple(dfs),
+        pillar_zero_rates=tuple(zeros),
         day_count=day_count,
         interpolation=interpolation,
         compounding=compounding,
@@ -271,6 +570,8 @@ def build_yield_curve_from_swaps(
     where tau_i are the period lengths and T is the swap maturity.
 
     This function bootstraps discount factors sequentially and converts to zero rates.
+    Curves are memoized by their inputs, so repeating a build with identical quotes
+    returns the same immutable YieldCurve; bumped quotes form a new key.
 
     Args:
         valuation_date: Curve valuation date.
@@ -294,23 +595,92 @@ def build_yield_curve_from_swaps(
     if len(swap_maturities) == 0:
         raise ValueError("At least one swap is required.")
 
+    key = (
+        valuation_date,
+        tuple(swap_maturities),
+        tuple(par_swap_rates),
+        swap_frequency,
+        day_count,
+        interpolation,
+        compounding,
+    )
+    cached = _SWAP_CURVE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     # Sort by maturity
     sorted_pairs = sorted(zip(swap_maturities, par_swap_rates), key=lambda x: x[0])
     sorted_maturities = [d for d, _ in sorted_pairs]
     sorted_rates = [r for _, r in sorted_pairs]
 
+    if interpolation not in _INTERP_CODES:
+        raise ValueError(f"Unsupported interpolation method: {interpolation}")
+    interp_code = _INTERP_CODES[interpolation]
+    comp_code = _comp_code_for(compounding)
+
     # Bootstrap discount factors sequentially
     pillar_dates: list[date] = []
     discount_factors: list[float] = []
+    # Working pillars of the partially bootstrapped curve, extended in place
+    # instead of rebuilding a YieldCurve for every swap
+    pillar_times: list[float] = []
+    pillar_zeros: list[float] = []
+    pillar_log_dfs: list[float] = []
+    # Schedules of successive swaps overlap, so the same periods recur; memoize
+    # their year fractions
+    denominator = _ACT_DENOMINATORS.get(day_count)
+    fraction_cache: dict[tuple[date, date], float] = {}
+
+    def period_fraction(start: date, end: date) -> float:
+        key = (start, end)
+        tau = fraction_cache.get(key)
+        if tau is None:
+            if denominator is not None:
+                tau = (end.toordinal() - start.toordinal()) / denominator
+            else:
+                tau = year_fraction(start, end, day_count)
+            fraction_cache[key] = tau
+        return tau
 
-    for swap_maturity, swap_rate in zip(sorted_maturities, sorted_rates):
-        # Generate payment schedule for this swap
-        schedule = generate_schedule(
-            valuation_date,
-            swap_maturity,
-            frequency=swap_frequency,
-            business_day_rule=BusinessDayRule.NONE,  # Use exact dates for bootstrapping
+    def time_from_valuation(d: date) -> float:
+        return period_fraction(valuation_date, d)
+
+    # Running sum of DF * tau along the payment schedule, keyed by payment date.
+    # Longer swaps extend the schedules of shorter ones, and a DF at or before the
+    # last pillar no longer changes as later pillars are added, so each prefix is
+    # priced once.
+    annuity_prefix: dict[date, float] = {}
+
+    def add_pillar(d: date, df: float) -> None:
+        t = time_from_valuation(d)
+        if t <= 0.0:
+            raise ValueError("All pillar dates must be after valuation_date.")
+        z = _zero_from_df(df, t, comp_code)
+        pillar_dates.append(d)
+        discount_factors.append(df)
+        pillar_times.append(t)
+        pillar_zeros.append(z)
+        pillar_log_dfs.append(_kernels.log_df_from_rate(z, t, comp_code))
+
+    # Every swap rolls from valuation_date at the same frequency, so each schedule is the
+    # longest swap's roll dates up to its maturity, closed by the maturity itself;
+    # generate the longest once and slice it per swap
+    if sorted_maturities[0] < valuation_date:
+        raise ValueError(
+            f"end_date ({sorted_maturities[0]}) must be >= start_date ({valuation_date})"
         )
+    longest_schedule = generate_schedule(
+        valuation_date,
+        sorted_maturities[-1],
+        frequency=swap_frequency,
+        business_day_rule=BusinessDayRule.NONE,  # Use exact dates for bootstrapping
+    )
+
+    for swap_maturity, swap_rate in zip(sorted_maturities, sorted_rates):
+        # Payment schedule for this swap
+        schedule = longest_schedule[: bisect_right(longest_schedule, swap_maturity)]
+        if schedule[-1] != swap_maturity:
+            schedule.append(swap_maturity)
 
         # Remove valuation_date if present (no payment at start)
         if schedule and schedule[0] == valuation_date:
@@ -319,57 +689,55 @@ def build_yield_curve_from_swaps(
         if not schedule:
             raise ValueError(f"Invalid swap schedule for maturity {swap_maturity}.")
 
-        # Build temporary curve from existing pillars for interpolation
-        if pillar_dates:
-            temp_curve = build_yield_curve_from_discount_factors(
-                valuation_date=valuation_date,
-                pillar_dates=tuple(pillar_dates),
-                discount_factors=tuple(discount_factors),
-                day_count=day_count,
-                interpolation=interpolation,
-                compounding=compounding,
-            )
-        else:
+        if not pillar_dates:
             # First swap: use simple rate approximation
-            t = year_fraction(valuation_date, swap_maturity, day_count)
+            t = time_from_valuation(swap_maturity)
             if t <= 0.0:
                 raise ValueError("All swap maturities must be after valuation_date.")
             # For first swap, assume simple rate: DF = 1 / (1 + r * t)
-            df_maturity = 1.0 / (1.0 + swap_rate * t)
-            pillar_dates.append(swap_maturity)
-            discount_factors.append(df_maturity)
+            add_pillar(swap_maturity, 1.0 / (1.0 + swap_rate * t))
             continue
 
-        # Calculate fixed leg PV using existing curve
+        # Calculate fixed leg PV using existing pillars
         # Fixed leg: sum of DF(t_i) * swap_rate * tau_i for all payment periods
         # We need to solve for DF(T) where T is the swap maturity
-        fixed_leg_pv_known = 0.0  # PV of payments before maturity
-        tau_maturity = 0.0  # Period length for final payment at maturity
-
-        # Iterate through payment periods
-        for i in range(len(schedule)):
-            if i == 0:
-                # First period: from valuation_date to first payment
-                start_date = valuation_date
-                end_date = schedule[0]
-            else:
-                # Subsequent periods: from previous payment to current payment
-                start_date = schedule[i - 1]
-                end_date = schedule[i]
-
-            tau = year_fraction(start_date, end_date, day_count)
-
-            if end_date == swap_maturity:
-                # This is the maturity payment - we'll solve for its DF
-                tau_maturity = tau
-            else:
-                # Known payment - use existing curve
-                df_pay = temp_curve.discount_factor(end_date)
-                fixed_leg_pv_known += df_pay * swap_rate * tau
-
-        # Handle case where maturity is not in schedule
-        if schedule[-1] != swap_maturity:
-            tau_maturity = year_fraction(schedule[-1], swap_maturity, day_count)
+        # Payments before maturity end at schedule[:n_known]
+        n_known = len(schedule) - 1 if schedule[-1] == swap_maturity else len(schedule)
+
+        # Resume from the latest payment whose running annuity is already known
+        resume = n_known
+        while resume > 0 and schedule[resume - 1] not in annuity_prefix:
+            resume -= 1
+        annuity_known = annuity_prefix[schedule[resume - 1]] if resume > 0 else 0.0
+
+        if resume < n_known:
+            # Price the remaining known payments on the pillars bootstrapped so far,
+            # in one pass
+            ends = schedule[resume:n_known]
+            starts = [schedule[resume - 1] if resume > 0 else valuation_date] + ends[:-1]
+            taus = [period_fraction(s, e) for s, e in zip(starts, ends)]
+            ts = np.asarray([time_from_valuation(d) for d in ends])
+            log_dfs_pay = _log_dfs_at_times(
+                np.asarray(pillar_times),
+                np.asarray(pillar_zeros),
+                np.asarray(pillar_log_dfs),
+                ts,
+                interp_code,
+                comp_code,
+            )
+            running = annuity_known + np.cumsum(np.exp(log_dfs_pay) * taus)
+            annuity_known = float(running[-1])
+            # DFs up to the last pillar are fixed from here on
+            last_pillar = pillar_dates[-1]
+            for d, annuity in zip(ends, running.tolist()):
+                if d > last_pillar:
+                    break
+                annuity_prefix[d] = annuity
+
+        fixed_leg_pv_known = swap_rate * annuity_known  # PV of payments before maturity
+        # Period length for final payment at maturity
+        last_known = schedule[n_known - 1] if n_known > 0 else valuation_date
+        tau_maturity = period_fraction(last_known, swap_maturity)
 
         # Floating leg PV = 1 - DF(T)
         # Fixed leg PV = fixed_leg_pv_known + DF(T) * swap_rate * tau_maturity
@@ -388,10 +756,9 @@ def build_yield_curve_from_swaps(
                 f"invalid discount factor {df_maturity}."
             )
 
-        pillar_dates.append(swap_maturity)
-        discount_factors.append(df_maturity)
+        add_pillar(swap_maturity, df_maturity)
 
-    return build_yield_curve_from_discount_factors(
+    curve = build_yield_curve_from_discount_factors(
         valuation_date=valuation_date,
         pillar_dates=tuple(pillar_dates),
         discount_factors=tuple(discount_factors),
@@ -399,5 +766,9 @@ def build_yield_curve_from_swaps(
         interpolation=interpolation,
         compounding=compounding,
     )
+    if len(_SWAP_CURVE_CACHE) >= _SWAP_CURVE_CACHE_SIZE:
+        _SWAP_CURVE_CACHE.clear()
+    _SWAP_CURVE_CACHE[key] = curve
+    return curve
 
 
@@ -7,17 +7,200 @@ Supports both exact and Euler discretization schemes.
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Literal
 
 import numpy as np
 
 from montecarlo_ir.market_data.yield_curve import YieldCurve
-from montecarlo_ir.utils.date_helpers import DayCountConvention
+from montecarlo_ir.utils.date_helpers import DayCountConvention, year_fraction
 
 DiscretizationScheme = Literal["exact", "euler"]
 
+# Minimum number of nodes in the theta grid used by the Euler scheme
+_THETA_GRID_MIN_POINTS = 256
+# Number of theta grids kept per model; the cache is cleared when full
+_THETA_CACHE_SIZE = 32
+# Number of market discount factors and bond price coefficients kept per model;
+# the caches are cleared when full
+_CURVE_CACHE_SIZE = 10_000
+# Decimal places of model time (years) in bond price coefficient cache keys
+_TIME_KEY_DECIMALS = 9
+# Curve-time bump for sampling instantaneous forward rates
+_FORWARD_BUMP = 1e-6
+# Days per year of the ACT day counts, for mapping day offsets to curve time
+_ACT_DAYS_PER_YEAR = {
+    DayCountConvention.ACT_360: 360.0,
+    DayCountConvention.ACT_365: 365.0,
+    DayCountConvention.ACT_365_25: 365.25,
+}
+# Relative tolerance under which a time grid's steps are treated as uniform
+_UNIFORM_STEP_RTOL = 1e-12
+# Largest cumulative log decay solved in one closed-form block (e^-200 ~ 1e-87)
+_MAX_LOG_DECAY_SPAN = 200.0
+
+
+def _time_steps(times: np.ndarray) -> np.ndarray:
+    """Step sizes of a simulation time grid, which must be strictly increasing."""
+    dt = np.diff(times)
+    if np.any(dt <= 0.0):
+        raise ValueError("Times must be strictly increasing.")
+    return dt
+
+
+def _uniform_step(dt: np.ndarray) -> float | None:
+    """Common step size if the steps are uniform to rounding (as from np.linspace), else None."""
+    if len(dt) == 0:
+        return None
+    h = float(dt[0])
+    if np.allclose(dt, h, rtol=_UNIFORM_STEP_RTOL, atol=0.0):
+        return h
+    return None
+
+
+def _standard_normal(shape: tuple[int, ...], rng: np.random.Generator | None) -> np.ndarray:
+    """Standard normal shocks drawn in a single call from rng or the global random state."""
+    if rng is None:
+        return np.random.standard_normal(shape)
+    return rng.standard_normal(shape)
+
+
+def _solve_linear_recurrence(
+    r0: float,
+    log_decay: np.ndarray,
+    increments: np.ndarray,
+    decay_sign: np.ndarray | None = None,
+) -> np.ndarray:
+    """Solve r[i] = c[i] * r[i-1] + u[i] in closed form.
+
+    With cumulative decay C[i] = c[1] * ... * c[i] = exp(log_decay[i]) (log_decay[0] = 0),
+    the recurrence unrolls to r[i] = C[i] * (r0 + sum_{j<=i} u[j] / C[j]), which NumPy
+    evaluates with a single cumulative sum instead of a Python loop over steps.
+    Increments may carry leading path dimensions; steps run along the last axis.
+    Negative factors c[i] are passed as log|C| in log_decay with the cumulative sign
+    of C in decay_sign.
+
+    log_decay must be non-increasing, i.e. |c[i]| <= 1. Long or strongly mean-reverting grids would
+    underflow C, so the closed form restarts from the last rate whenever the decay
+    since the block start exceeds _MAX_LOG_DECAY_SPAN.
+    """
+    n = len(log_decay)
+    rates = np.empty(increments.shape[:-1] + (n,))
+    rates[..., 0] = r0
+    start = 0
+    while start < n - 1:
+        # Last index whose decay since the block start stays within the span
+        end = int(np.searchsorted(-log_decay, _MAX_LOG_DECAY_SPAN - log_decay[start], "right"))
+        if end <= start + 1:
+            # A single step decays past the span: take it directly
+            decay = math.exp(log_decay[start + 1] - log_decay[start])
+            if decay_sign is not None:
+                decay *= decay_sign[start + 1] * decay_sign[start]
+            rates[..., start + 1] = decay * rates[..., start] + increments[..., start]
+            start += 1
+            continue
+        decay_cum = np.exp(log_decay[start + 1 : end] - log_decay[start])
+        if decay_sign is not None:
+            decay_cum *= decay_sign[start + 1 : end] * decay_sign[start]
+        block = np.cumsum(increments[..., start : end - 1] / decay_cum, axis=-1)
+        rates[..., start + 1 : end] = decay_cum * (rates[..., start : start + 1] + block)
+        start = end - 1
+    return rates
+
+
+def _exact_path(
+    times: np.ndarray,
+    dt: np.ndarray,
+    r0: float,
+    a: float,
+    sigma: float,
+    shocks: np.ndarray,
+    theta_integrals: np.ndarray,
+) -> np.ndarray:
+    """Short-rate path under the exact scheme.
+
+    Args:
+        times: Strictly increasing time grid (years).
+        dt: Step sizes of the time grid.
+        r0: Short rate at times[0].
+        a: Mean reversion speed.
+        sigma: Volatility.
+        shocks: Standard normal shocks, one per step along the last axis.
+        theta_integrals: Integral of theta over each step.
+
+    Returns:
+        Short rates at each time point, with the leading shape of shocks.
+    """
+    # Exact solution: r(t) = e^(-a*dt) * r(s) + integral_term + stochastic_term
+    # Stochastic term; a uniform grid needs a single exp/sqrt
+    h = _uniform_step(dt)
+    if h is not None:
+        std: float | np.ndarray = math.sqrt(
+            (sigma**2 / (2.0 * a)) * (-math.expm1(-2.0 * a * h))
+        )
+    else:
+        std = np.sqrt((sigma**2 / (2.0 * a)) * (-np.expm1(-2.0 * a * dt)))
+    increments = theta_integrals + std * shocks
+    # Mean reversion term: the decay compounds to e^(-a*(t_i - t_0)) from the start
+    return _solve_linear_recurrence(r0, -a * (times - times[0]), increments)
+
+
+def _euler_path(
+    times: np.ndarray,
+    dt: np.ndarray,
+    r0: float,
+    a: float,
+    sigma: float,
+    shocks: np.ndarray,
+    theta_values: np.ndarray,
+) -> np.ndarray:
+    """Short-rate path under the Euler scheme.
+
+    Args:
+        times: Strictly increasing time grid (years).
+        dt: Step sizes of the time grid.
+        r0: Short rate at times[0].
+        a: Mean reversion speed.
+        sigma: Volatility.
+        shocks: Standard normal shocks, one per step along the last axis.
+        theta_values: Theta at the start of each step.
+
+    Returns:
+        Short rates at each time point, with the leading shape of shocks.
+    """
+    h = _uniform_step(dt)
+    # Euler scheme: dr = (theta - a*r)*dt + sigma*dW
+    if h is not None:
+        # Uniform grid: one sqrt and one log for all steps
+        increments = theta_values * h + (sigma * math.sqrt(h)) * shocks
+        c = 1.0 - a * h
+        if 0.0 < abs(c) <= 1.0:
+            steps = np.arange(len(times))
+            log_decay = math.log(abs(c)) * steps
+            # Steps longer than 1/a flip the sign of the decay every step
+            sign = None if c > 0.0 else np.where(steps % 2 == 0, 1.0, -1.0)
+            return _solve_linear_recurrence(r0, log_decay, increments, sign)
+        decay = np.full(len(dt), c)
+    else:
+        increments = theta_values * dt + sigma * np.sqrt(dt) * shocks
+        decay = 1.0 - a * dt
+        abs_decay = np.abs(decay)
+        if np.all((abs_decay > 0.0) & (abs_decay <= 1.0)):
+            log_decay = np.concatenate(([0.0], np.cumsum(np.log(abs_decay))))
+            sign = None
+            if np.any(decay < 0.0):
+                sign = np.concatenate(([1.0], np.cumprod(np.sign(decay))))
+            return _solve_linear_recurrence(r0, log_decay, increments, sign)
+
+    # Steps of exactly 1/a or longer than 2/a (where Euler amplifies); step through
+    rates = np.empty(increments.shape[:-1] + (len(times),))
+    rates[..., 0] = r0
+    for i, c in enumerate(decay.tolist(), start=1):
+        rates[..., i] = c * rates[..., i - 1] + increments[..., i - 1]
+    return rates
+
 
 @dataclass(frozen=True)
 class HullWhite1F:
@@ -46,6 +229,19 @@ class HullWhite1F:
     scheme: DiscretizationScheme = "exact"
     day_count: DayCountConvention = DayCountConvention.ACT_365
 
+    # Derived state, set in __post_init__
+    _theta_cache: dict[tuple[float, float, int], tuple[np.ndarray, np.ndarray]] = field(
+        init=False, repr=False, compare=False
+    )
+    _days_per_year: float = field(init=False, repr=False, compare=False)
+    _valuation_ordinal: int = field(init=False, repr=False, compare=False)
+    _df_cache: dict[float, float] = field(init=False, repr=False, compare=False)
+    _ab_cache: dict[tuple[float, float], tuple[float, float]] = field(init=False, repr=False, compare=False)
+    _curve_denominator: float | None = field(init=False, repr=False, compare=False)
+    _curve_time_scale: float = field(init=False, repr=False, compare=False)
+    _sim_kernel: Callable[..., np.ndarray] = field(init=False, repr=False, compare=False)
+    _theta_terms: Callable[..., np.ndarray] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Validate model parameters."""
         if self.mean_reversion <= 0.0:
@@ -53,8 +249,40 @@ class HullWhite1F:
         if self.volatility <= 0.0:
             raise ValueError("volatility must be positive.")
 
+        # Specialize the simulation to the scheme once: the path function and the
+        # matching theta terms. Both are module-level or bound methods so the model pickles
+        object.__setattr__(
+            self, "_sim_kernel", _exact_path if self.scheme == "exact" else _euler_path
+        )
+        theta_terms = self._theta_integrals if self.scheme == "exact" else self._theta_values
+        object.__setattr__(self, "_theta_terms", theta_terms)
+        # Theta tables by grid span, reused across Euler paths on the same grid
+        object.__setattr__(self, "_theta_cache", {})
+        # Model time to whole days after valuation: ACT/360 counts 360 days a year,
+        # all others 365
+        days_per_year = 360.0 if self.day_count == DayCountConvention.ACT_360 else 365.0
+        object.__setattr__(self, "_days_per_year", days_per_year)
+        object.__setattr__(
+            self, "_valuation_ordinal", self.yield_curve.valuation_date.toordinal()
+        )
+        # Curve times of whole days after valuation are days / denominator on ACT curves
+        object.__setattr__(
+            self, "_curve_denominator", _ACT_DAYS_PER_YEAR.get(self.yield_curve.day_count)
+        )
+        # Curve years per model year when sampling the curve continuously in time;
+        # non-ACT curve day counts are taken at 365.25 actual days per year
+        curve_days_per_year = self._curve_denominator or 365.25
+        object.__setattr__(self, "_curve_time_scale", days_per_year / curve_days_per_year)
+        # Market discount factors by model time, shared by every path priced on a grid
+        object.__setattr__(self, "_df_cache", {})
+        # Bond price coefficients A(t, T), B(t, T) by (t, T)
+        object.__setattr__(self, "_ab_cache", {})
+
     def simulate_short_rate_path(
-        self, times: list[float] | np.ndarray, random_shocks: np.ndarray | None = None
+        self,
+        times: list[float] | np.ndarray,
+        random_shocks: np.ndarray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> np.ndarray:
         """Simulate a short rate path.
 
@@ -62,25 +290,73 @@ class HullWhite1F:
             times: Array of time points (years from valuation_date).
             random_shocks: Optional array of random shocks (standard normal).
                          If None, generates random shocks.
+            rng: Generator used to draw the shocks when random_shocks is None.
+                If None, the global NumPy random state is used.
 
         Returns:
             Array of short rates at each time point.
         """
-        times_array = np.asarray(times, dtype=float)
-        if len(times_array) == 0:
+        times_array = np.ascontiguousarray(times, dtype=np.float64)
+        n = len(times_array)
+        if n == 0:
             return np.array([])
 
+        if random_shocks is not None:
+            random_shocks = np.asarray(random_shocks, dtype=np.float64)
+            if random_shocks.shape != (n - 1,):
+                raise ValueError(f"random_shocks must have length {n - 1}.")
+            random_shocks = random_shocks[np.newaxis]
+
+        # A single path is a batch of one
+        path: np.ndarray = self.simulate_short_rate_paths(times_array, 1, random_shocks, rng)[0]
+        return path
+
+    def simulate_short_rate_paths(
+        self,
+        times: list[float] | np.ndarray,
+        n_paths: int,
+        random_shocks: np.ndarray | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> np.ndarray:
+        """Simulate a batch of short rate paths on a shared time grid.
+
+        Theta terms and the decay and variance factors are computed once for the grid
+        and applied to all paths together.
+
+        Args:
+            times: Array of time points (years from valuation_date).
+            n_paths: Number of paths to simulate.
+            random_shocks: Optional array of random shocks (standard normal) with
+                         shape (n_paths, len(times) - 1). If None, generates random shocks.
+            rng: Generator used to draw all shocks in one call when random_shocks is None.
+                If None, the global NumPy random state is used.
+
+        Returns:
+            Array of short rates with shape (n_paths, len(times)).
+        """
+        if n_paths <= 0:
+            raise ValueError("n_paths must be positive.")
+
+        times_array = np.ascontiguousarray(times, dtype=np.float64)
+        n = len(times_array)
+        if n == 0:
+            return np.empty((n_paths, 0))
+
         t0 = times_array[0]
         if t0 < 0.0:
             raise ValueError("All times must be non-negative.")
 
+        if random_shocks is None:
+            random_shocks = _standard_normal((n_paths, n - 1), rng)
+        else:
+            random_shocks = np.asarray(random_shocks, dtype=np.float64)
+            if random_shocks.shape != (n_paths, n - 1):
+                raise ValueError(f"random_shocks must have shape ({n_paths}, {n - 1}).")
+
         # Initial short rate from yield curve
         r0 = self._initial_short_rate(t0)
 
-        if self.scheme == "exact":
-            return self._simulate_exact(times_array, r0, random_shocks)
-        else:
-            return self._simulate_euler(times_array, r0, random_shocks)
+        return self._simulate(times_array, r0, random_shocks)
 
     def bond_price(self, t: float, T: float, r_t: float) -> float:
         """Calculate zero-coupon bond price P(t, T) given short rate at time t.
@@ -98,27 +374,37 @@ class HullWhite1F:
         if t < 0.0 or T < 0.0:
             raise ValueError("Times must be non-negative.")
 
-        tau = T - t
-        if tau == 0.0:
+        if T == t:
             return 1.0
 
-        a = self.mean_reversion
-        sigma = self.volatility
+        A, B = self._ab_coeffs(t, T)
+        return A * math.exp(-B * r_t)
 
-        # Get market bond prices from yield curve
-        t_date = self._time_to_date(t)
-        T_date = self._time_to_date(T)
+    def bond_prices_over_paths(self, t: float, T: float, r_paths: np.ndarray) -> np.ndarray:
+        """Calculate zero-coupon bond prices P(t, T) for many short rates at time t.
 
-        P_market_t = self.yield_curve.discount_factor(t_date)
-        P_market_T = self.yield_curve.discount_factor(T_date)
+        The deterministic A(t, T) and B(t, T) factors are computed once and applied to
+        all short rates in a single vectorized exponential.
 
-        # Calculate A(t, T) and B(t, T) for Hull-White
-        B = (1.0 - math.exp(-a * tau)) / a
-        A = (P_market_T / P_market_t) * math.exp(
-            B * self._forward_rate_integral(t, T) - 0.5 * (sigma**2 / a**2) * (B - tau) * (1.0 - math.exp(-2.0 * a * t))
-        )
+        Args:
+            t: Current time (years from valuation_date).
+            T: Bond maturity time (years from valuation_date).
+            r_paths: Short rates at time t, e.g. one per simulated path.
 
-        return A * math.exp(-B * r_t)
+        Returns:
+            Bond prices P(t, T) with the shape of r_paths.
+        """
+        if T < t:
+            raise ValueError("Bond maturity T must be >= current time t.")
+        if t < 0.0 or T < 0.0:
+            raise ValueError("Times must be non-negative.")
+
+        r = np.asarray(r_paths, dtype=float)
+        if T == t:
+            return np.ones_like(r)
+
+        A, B = self._ab_coeffs(t, T)
+        return A * np.exp(-B * r)
 
     def discount_factor(self, t: float, T: float, r_t: float) -> float:
         """Calculate discount factor from time t to T.
@@ -137,145 +423,172 @@ class HullWhite1F:
 
     def _initial_short_rate(self, t: float) -> float:
         """Get initial short rate from yield curve."""
-        t_date = self._time_to_date(t)
-        return self.yield_curve.zero_rate(t_date)
-
-    def _simulate_exact(
-        self, times: np.ndarray, r0: float, random_shocks: np.ndarray | None
-    ) -> np.ndarray:
-        """Exact simulation using analytical solution."""
-        n = len(times)
-        if random_shocks is None:
-            random_shocks = np.random.standard_normal(n - 1)
-        else:
-            if len(random_shocks) != n - 1:
-                raise ValueError(f"random_shocks must have length {n - 1}.")
-
-        a = self.mean_reversion
-        sigma = self.volatility
-        rates = np.zeros(n)
-        rates[0] = r0
-
-        for i in range(1, n):
-            dt = times[i] - times[i - 1]
-            if dt <= 0.0:
-                raise ValueError("Times must be strictly increasing.")
-
-            # Exact solution: r(t) = e^(-a*dt) * r(s) + integral_term + stochastic_term
-            # Mean reversion term
-            mean_rev_term = rates[i - 1] * math.exp(-a * dt)
-
-            # Drift term (theta integral)
-            drift_term = self._theta_integral(times[i - 1], times[i])
-
-            # Stochastic term
-            variance = (sigma**2 / (2.0 * a)) * (1.0 - math.exp(-2.0 * a * dt))
-            stoch_term = math.sqrt(variance) * random_shocks[i - 1]
-
-            rates[i] = mean_rev_term + drift_term + stoch_term
+        return self.yield_curve.zero_rate_t(self._curve_time(t))
 
-        return rates
+    def _simulate(self, times: np.ndarray, r0: float, random_shocks: np.ndarray) -> np.ndarray:
+        """Simulate with the scheme kernel chosen at construction.
 
-    def _simulate_euler(
-        self, times: np.ndarray, r0: float, random_shocks: np.ndarray | None
-    ) -> np.ndarray:
-        """Euler discretization scheme."""
-        n = len(times)
-        if random_shocks is None:
-            random_shocks = np.random.standard_normal(n - 1)
-        else:
-            if len(random_shocks) != n - 1:
-                raise ValueError(f"random_shocks must have length {n - 1}.")
-
-        a = self.mean_reversion
-        sigma = self.volatility
-        rates = np.zeros(n)
-        rates[0] = r0
-
-        for i in range(1, n):
-            dt = times[i] - times[i - 1]
-            if dt <= 0.0:
-                raise ValueError("Times must be strictly increasing.")
-
-            # Euler scheme: dr = (theta - a*r)*dt + sigma*dW
-            theta_t = self._theta(times[i - 1])
-            drift = (theta_t - a * rates[i - 1]) * dt
-            diffusion = sigma * math.sqrt(dt) * random_shocks[i - 1]
-
-            rates[i] = rates[i - 1] + drift + diffusion
+        Shocks are validated by the callers; the grid is validated here once and its
+        step sizes shared with the kernel.
+        """
+        dt = _time_steps(times)
+
+        # Drift term: theta integrals (exact) or theta at step starts (Euler)
+        return self._sim_kernel(
+            times,
+            dt,
+            r0,
+            self.mean_reversion,
+            self.volatility,
+            random_shocks,
+            self._theta_terms(times),
+        )
 
-        return rates
+    def _theta_values(self, times: np.ndarray) -> np.ndarray:
+        """Theta at the start of each step of a time grid.
 
-    def _theta(self, t: float) -> float:
-        """Calculate theta(t) to fit yield curve."""
+        Theta is tabulated once on a fine uniform grid spanning the times and
+        interpolated, so repeated grids reuse the table.
+        """
+        if len(times) < 2:
+            return np.empty(0)
+
+        n_points = max(_THETA_GRID_MIN_POINTS, 4 * len(times))
+        key = (float(times[0]), float(times[-1]), n_points)
+        cache = self._theta_cache
+        table = cache.get(key)
+        if table is None:
+            tau_grid = np.linspace(times[0], times[-1], n_points)
+            table = (tau_grid, self._theta_grid(tau_grid))
+            if len(cache) >= _THETA_CACHE_SIZE:
+                cache.clear()
+            cache[key] = table
+
+        tau_grid, theta_grid = table
+        theta: np.ndarray = np.interp(times[:-1], tau_grid, theta_grid)
+        return theta
+
+    def _theta_grid(self, tau_grid: np.ndarray) -> np.ndarray:
+        """Theta on a strictly increasing grid from one vectorized curve sampling."""
         # Theta is derived from the requirement that the model fits the yield curve
         # θ(t) = ∂f/∂t + a*f(t) + (σ²/(2a))*(1 - exp(-2a*t))
         # where f(t) is the instantaneous forward rate
+        a = self.mean_reversion
+        sigma = self.volatility
+        f = self._instantaneous_forwards(tau_grid)
+        df_dt = np.gradient(f, tau_grid)
+        theta: np.ndarray = (
+            df_dt + a * f + (sigma**2 / (2.0 * a)) * (-np.expm1(-2.0 * a * tau_grid))
+        )
+        return theta
 
-        t_date = self._time_to_date(t)
-
-        # Use a minimum increment to avoid date equality issues
-        eps = max(1e-4, t * 1e-6)  # Ensure eps is meaningful relative to t
-        t1_date = self._time_to_date(t + eps)
+    def _instantaneous_forwards(self, ts: np.ndarray) -> np.ndarray:
+        """Instantaneous curve forward rates at model times ts (right-continuous at pillars)."""
+        curve_ts = ts * self._curve_time_scale
+        return self.yield_curve.forward_rate_batch(curve_ts, curve_ts + _FORWARD_BUMP)
 
-        # Ensure dates are different
-        if t1_date <= t_date:
-            t1_date = self._time_to_date(t + max(0.01, t * 0.01))
+    def _theta_integral(self, s: float, t: float) -> float:
+        """Calculate integral of theta from s to t."""
+        if t == s:
+            return 0.0
+        return float(self._theta_integrals(np.array([s, t]))[0])
 
-        f_t = self.yield_curve.forward_rate(t_date, t1_date)
+    def _theta_integrals(self, times: np.ndarray) -> np.ndarray:
+        """Integrals of theta over each step of a strictly increasing time grid.
 
-        # Approximate ∂f/∂t using finite difference
-        t2_date = self._time_to_date(t + 2 * eps)
-        if t2_date <= t1_date:
-            t2_date = self._time_to_date(t + max(0.02, t * 0.02))
-        f_t_plus = self.yield_curve.forward_rate(t1_date, t2_date)
-        df_dt = (f_t_plus - f_t) / eps
+        Each term of theta integrates in closed form: the ∂f/∂t term to the change in
+        the forward rate, the a*f term to the log discount factor ratio and the
+        convexity term analytically. This needs the curve only at the step times and
+        stays exact across the forward rate jumps at curve pillars.
+        """
+        if len(times) < 2:
+            return np.empty(0)
 
         a = self.mean_reversion
         sigma = self.volatility
+        scale = self._curve_time_scale
+
+        f = self._instantaneous_forwards(times)
+        log_dfs = np.log(self.yield_curve.discount_factor_batch(times * scale))
+        dt = np.diff(times)
+        # ∫ σ²/(2a) * (1 - exp(-2a*u)) du over [s, s + dt]
+        convexity = (sigma**2 / (2.0 * a)) * (
+            dt + np.exp(-2.0 * a * times[:-1]) * np.expm1(-2.0 * a * dt) / (2.0 * a)
+        )
+        # Model time runs at 1/scale of curve time, so ∫ a*f(scale*u) du = -(a/scale)*Δlog P
+        return np.diff(f) - (a / scale) * np.diff(log_dfs) + convexity
 
-        return df_dt + a * f_t + (sigma**2 / (2.0 * a)) * (1.0 - math.exp(-2.0 * a * t))
-
-    def _theta_integral(self, s: float, t: float) -> float:
-        """Calculate integral of theta from s to t."""
-        # For exact simulation, we need the integral of theta
-        # This is approximated using numerical integration
-        # For simplicity, use trapezoidal rule with a few points
-        n_points = 10
-        dt = (t - s) / n_points
-        integral = 0.0
-
-        for i in range(n_points + 1):
-            tau = s + i * dt
-            weight = 1.0 if (i == 0 or i == n_points) else 2.0
-            integral += weight * self._theta(tau)
+    def _ab_coeffs(self, t: float, T: float) -> tuple[float, float]:
+        """Hull-White A(t, T) and B(t, T) with P(t, T) = A * exp(-B * r_t), memoized.
 
-        return integral * dt / 2.0
+        Times are keyed, and the coefficients computed, at _TIME_KEY_DECIMALS decimals
+        so that times reached by different float arithmetic share an entry.
+        """
+        cache = self._ab_cache
+        key = (round(t, _TIME_KEY_DECIMALS), round(T, _TIME_KEY_DECIMALS))
+        coeffs = cache.get(key)
+        if coeffs is None:
+            t, T = key
+            a = self.mean_reversion
+            sigma = self.volatility
+            tau = T - t
+
+            # Get market bond prices from yield curve
+            P_market_t = self._market_discount_factor(t)
+            P_market_T = self._market_discount_factor(T)
+
+            # Calculate A(t, T) and B(t, T) for Hull-White
+            B = -math.expm1(-a * tau) / a
+            variance_term = 0.5 * (sigma**2 / a**2) * (B - tau) * (-math.expm1(-2.0 * a * t))
+            A = (P_market_T / P_market_t) * math.exp(
+                B * self._forward_rate_integral(t, T) - variance_term
+            )
+            coeffs = (A, B)
+            if len(cache) >= _CURVE_CACHE_SIZE:
+                cache.clear()
+            cache[key] = coeffs
+        return coeffs
 
     def _forward_rate_integral(self, t: float, T: float) -> float:
         """Calculate integral of forward rate from t to T."""
-        # Approximate using yield curve forward rates
-        t_date = self._time_to_date(t)
-        T_date = self._time_to_date(T)
-
-        # Use forward rate over the period
-        fwd = self.yield_curve.forward_rate(t_date, T_date)
+        # Approximate using yield curve forward rates over the period
+        days_per_year = self._days_per_year
+        fwd = self._curve_forward_rate(int(t * days_per_year), int(T * days_per_year))
         return fwd * (T - t)
 
-    def _time_to_date(self, t: float) -> date:
-        """Convert time (years) to date using day count convention."""
-        val_date = self.yield_curve.valuation_date
-        # Use approximate conversion - for exact dates, we'd need to iterate
-        # This is a simple approximation that works for most cases
-        from datetime import timedelta
-
-        if self.day_count == DayCountConvention.ACT_365:
-            days = int(t * 365.0)
-        elif self.day_count == DayCountConvention.ACT_360:
-            days = int(t * 360.0)
-        else:
-            # Default to ACT/365
-            days = int(t * 365.0)
-
-        return val_date + timedelta(days=days)
-
+    def _market_discount_factor(self, t: float) -> float:
+        """Yield curve discount factor at model time t, memoized by t."""
+        cache = self._df_cache
+        df = cache.get(t)
+        if df is None:
+            df = self.yield_curve.discount_factor_t(self._curve_time(t))
+            if len(cache) >= _CURVE_CACHE_SIZE:
+                cache.clear()
+            cache[t] = df
+        return df
+
+    def _curve_time(self, t: float) -> float:
+        """Yield curve time of the date that model time t maps to."""
+        days = int(t * self._days_per_year)
+        denominator = self._curve_denominator
+        if denominator is not None:
+            return days / denominator
+        d = date.fromordinal(self._valuation_ordinal + days)
+        return year_fraction(self.yield_curve.valuation_date, d, self.yield_curve.day_count)
+
+    def _curve_forward_rate(self, start_days: int, end_days: int) -> float:
+        """Curve forward rate between the dates start_days and end_days after valuation.
+
+        ACT curves accrue exactly the day difference, so the forward is taken on curve
+        times directly; other conventions accrue by date and go through the dates.
+        """
+        denominator = self._curve_denominator
+        if denominator is not None:
+            return self.yield_curve.forward_rate_t(
+                start_days / denominator, end_days / denominator
+            )
+        valuation_ordinal = self._valuation_ordinal
+        return self.yield_curve.forward_rate(
+            date.fromordinal(valuation_ordinal + start_days),
+            date.fromordinal(valuation_ordinal + end_days),
+        )
@@ -7,9 +7,10 @@ This module provides functions for:
 - Date validation and conversions
 """
 
+from collections.abc import Callable, Collection, Sequence
 from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Final
+from typing import Final, Literal, overload
 
 import numpy as np
 
@@ -73,79 +74,181 @@ def days_between(
         >>> days_between(date(2024, 1, 1), date(2024, 7, 1), DayCountConvention.ACT_360)
         0.5
     """
-    if end_date < start_date:
+    # Ordinal subtraction counts the days without building a timedelta
+    days = end_date.toordinal() - start_date.toordinal()
+    if days < 0:
         raise ValueError(f"end_date ({end_date}) must be >= start_date ({start_date})")
 
-    if convention == DayCountConvention.ACT_360:
-        return (end_date - start_date).days / 360.0
+    # ACT/360, ACT/365 and ACT/365.25 differ only in the denominator
+    denominator = _ACT_DENOMINATORS.get(convention)
+    if denominator is not None:
+        return days / denominator
 
-    elif convention == DayCountConvention.ACT_365:
-        return (end_date - start_date).days / 365.0
+    fraction = _DAY_COUNT_FRACTIONS.get(convention)
+    if fraction is None:
+        raise ValueError(f"Unsupported day count convention: {convention}")
+    return fraction(start_date, end_date)
 
-    elif convention == DayCountConvention.ACT_365_25:
-        return (end_date - start_date).days / 365.25
 
-    elif convention == DayCountConvention.ACT_ACT:
-        # Actual/Actual: count actual days in each period
-        # and divide by actual days in the year
-        year_start = date(start_date.year, 1, 1)
-        year_end = date(start_date.year + 1, 1, 1)
-        days_in_year = (year_end - year_start).days
+def _act_act_fraction(start_date: date, end_date: date) -> float:
+    """ACT/ACT year fraction for start_date <= end_date."""
+    # Actual/Actual: count actual days in each period
+    # and divide by actual days in the year
+    start_year = start_date.year
+    end_year = end_date.year
+    days_in_start_year = _days_in_year(start_year)
 
-        if start_date.year == end_date.year:
-            return (end_date - start_date).days / days_in_year
-        else:
-            # Span multiple years
-            total_days = 0.0
-            current_year = start_date.year
-
-            # Days in first year
-            year_end_date = date(current_year + 1, 1, 1)
-            days_in_first_year = (year_end_date - year_start).days
-            total_days += (year_end_date - start_date).days / days_in_first_year
-
-            # Full years in between
-            current_year += 1
-            while current_year < end_date.year:
-                year_start_date = date(current_year, 1, 1)
-                year_end_date = date(current_year + 1, 1, 1)
-                days_in_year = (year_end_date - year_start_date).days
-                total_days += 1.0  # Full year
-                current_year += 1
-
-            # Days in last year
-            if current_year == end_date.year:
-                year_start_date = date(current_year, 1, 1)
-                year_end_date = date(current_year + 1, 1, 1)
-                days_in_last_year = (year_end_date - year_start_date).days
-                total_days += (end_date - year_start_date).days / days_in_last_year
-
-            return total_days
-
-    elif convention == DayCountConvention.THIRTY_360:
-        # 30/360: Assume 30 days per month, 360 days per year
-        d1, m1, y1 = start_date.day, start_date.month, start_date.year
-        d2, m2, y2 = end_date.day, end_date.month, end_date.year
-
-        # Adjust day if it's 31
-        if d1 == 31:
-            d1 = 30
-        if d2 == 31 and d1 == 30:
-            d2 = 30
-
-        days = 360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)
-        return days / 360.0
+    if start_year == end_year:
+        return (end_date.toordinal() - start_date.toordinal()) / days_in_start_year
 
-    else:
-        raise ValueError(f"Unsupported day count convention: {convention}")
+    # Span multiple years: remainder of the first year, whole years in between
+    # (1.0 each) and the elapsed part of the last year
+    first_part = (
+        date(start_year + 1, 1, 1).toordinal() - start_date.toordinal()
+    ) / days_in_start_year
+    last_part = (end_date.toordinal() - date(end_year, 1, 1).toordinal()) / _days_in_year(end_year)
+    return first_part + (end_year - start_year - 1) + last_part
+
+
+def _days_in_year(year: int) -> int:
+    """Number of days in a year."""
+    return 366 if _is_leap_year(year) else 365
+
+
+def _is_leap_year(year: int) -> bool:
+    """Gregorian leap year check."""
+    # The year % 4 test alone settles three years in four
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _thirty_360_fraction(start_date: date, end_date: date) -> float:
+    """30/360 year fraction for start_date <= end_date."""
+    # 30/360: Assume 30 days per month, 360 days per year
+    d1, m1, y1 = start_date.day, start_date.month, start_date.year
+    d2, m2, y2 = end_date.day, end_date.month, end_date.year
+
+    # Adjust day if it's 31
+    if d1 == 31:
+        d1 = 30
+    if d2 == 31 and d1 == 30:
+        d2 = 30
 
+    days = 360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)
+    return days / 360.0
+
+
+_ACT_DENOMINATORS: Final[dict[DayCountConvention, float]] = {
+    DayCountConvention.ACT_360: 360.0,
+    DayCountConvention.ACT_365: 365.0,
+    DayCountConvention.ACT_365_25: 365.25,
+}
+_DAY_COUNT_FRACTIONS: Final[dict[DayCountConvention, Callable[[date, date], float]]] = {
+    DayCountConvention.ACT_ACT: _act_act_fraction,
+    DayCountConvention.THIRTY_360: _thirty_360_fraction,
+}
+
+
+def days_between_vec(
+    start_ordinals: np.ndarray,
+    end_ordinals: np.ndarray,
+    convention: DayCountConvention = DayCountConvention.ACT_360,
+) -> np.ndarray:
+    """Vectorized `days_between` over arrays of date ordinals (`date.toordinal`).
+
+    Args:
+        start_ordinals: Start date ordinals.
+        end_ordinals: End date ordinals, broadcast against start_ordinals.
+        convention: Day count convention to use. Defaults to ACT/360.
+
+    Returns:
+        Year fractions with the broadcast shape of the inputs.
+
+    Raises:
+        ValueError: If any end date is before its start date.
+    """
+    start = np.asarray(start_ordinals, dtype=np.int64)
+    end = np.asarray(end_ordinals, dtype=np.int64)
+    if np.any(end < start):
+        raise ValueError("end_ordinals must be >= start_ordinals")
 
-def is_business_day(d: date, calendar: list[date] | None = None) -> bool:
+    denominator = _ACT_DENOMINATORS.get(convention)
+    if denominator is not None:
+        return (end - start) / denominator
+
+    fraction = _DAY_COUNT_FRACTIONS_VEC.get(convention)
+    if fraction is None:
+        raise ValueError(f"Unsupported day count convention: {convention}")
+    start, end = np.broadcast_arrays(start, end)
+    return fraction(start, end)
+
+
+def _ordinals_to_ymd(ordinals: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Year, month and day arrays of date ordinals."""
+    days = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+    months = days.astype("datetime64[M]")
+    years = months.astype("datetime64[Y]").astype(np.int64) + 1970
+    month_numbers = months.astype(np.int64) % 12 + 1
+    day_numbers = (days - months.astype("datetime64[D]")).astype(np.int64) + 1
+    return years, month_numbers, day_numbers
+
+
+def _jan1_ordinals(years: np.ndarray) -> np.ndarray:
+    """Ordinals of January 1st of each year."""
+    jan1 = (years - 1970).astype("datetime64[Y]").astype("datetime64[D]")
+    return jan1.astype(np.int64) + _EPOCH_ORDINAL
+
+
+def _act_act_fraction_vec(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Vectorized `_act_act_fraction` on ordinals."""
+    # Year index of each date: table lookups instead of datetime64 conversions
+    start_idx = np.searchsorted(_YEAR_START_ORDINALS, start, side="right") - 1
+    end_idx = np.searchsorted(_YEAR_START_ORDINALS, end, side="right") - 1
+    start_jan1 = _YEAR_START_ORDINALS[start_idx]
+    start_next_jan1 = _YEAR_START_ORDINALS[start_idx + 1]
+    end_jan1 = _YEAR_START_ORDINALS[end_idx]
+    end_next_jan1 = _YEAR_START_ORDINALS[end_idx + 1]
+
+    start_year_days = start_next_jan1 - start_jan1
+    same_year = (end - start) / start_year_days
+    # Remainder of the first year, full years in between, part of the last year
+    spanning = (
+        (start_next_jan1 - start) / start_year_days
+        + (end_idx - start_idx - 1)
+        + (end - end_jan1) / (end_next_jan1 - end_jan1)
+    )
+    fractions: np.ndarray = np.where(start_idx == end_idx, same_year, spanning)
+    return fractions
+
+
+def _thirty_360_fraction_vec(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Vectorized `_thirty_360_fraction` on ordinals."""
+    y1, m1, d1 = _ordinals_to_ymd(start)
+    y2, m2, d2 = _ordinals_to_ymd(end)
+    d1 = np.where(d1 == 31, 30, d1)
+    d2 = np.where((d2 == 31) & (d1 == 30), 30, d2)
+    days = 360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)
+    fractions: np.ndarray = days / 360.0
+    return fractions
+
+
+_EPOCH_ORDINAL: Final = date(1970, 1, 1).toordinal()
+# Ordinals of January 1st for years 1..10000 (the last one is one past date.max)
+_YEAR_START_ORDINALS: Final = _jan1_ordinals(np.arange(1, 10001))
+_DAY_COUNT_FRACTIONS_VEC: Final[
+    dict[DayCountConvention, Callable[[np.ndarray, np.ndarray], np.ndarray]]
+] = {
+    DayCountConvention.ACT_ACT: _act_act_fraction_vec,
+    DayCountConvention.THIRTY_360: _thirty_360_fraction_vec,
+}
+
+
+def is_business_day(d: date, calendar: Collection[date] | None = None) -> bool:
     """Check if a date is a business day.
 
     Args:
         d: Date to check.
-        calendar: List of holidays. If None, only weekends are considered non-business days.
+        calendar: Holidays. If None, only weekends are considered non-business days.
+            Pass a frozenset to skip the per-call set conversion when reusing a calendar.
 
     Returns:
         True if the date is a business day, False otherwise.
@@ -162,14 +265,17 @@ def is_business_day(d: date, calendar: list[date] | None = None) -> bool:
 
 
 def adjust_business_day(
-    d: date, rule: BusinessDayRule = BusinessDayRule.FOLLOWING, calendar: list[date] | None = None
+    d: date,
+    rule: BusinessDayRule = BusinessDayRule.FOLLOWING,
+    calendar: Collection[date] | None = None,
 ) -> date:
     """Adjust a date according to a business day rule.
 
     Args:
         d: Date to adjust.
         rule: Business day adjustment rule.
-        calendar: List of holidays. If None, only weekends are considered non-business days.
+        calendar: Holidays. If None, only weekends are considered non-business days.
+            Pass a frozenset to skip the per-call set conversion when reusing a calendar.
 
     Returns:
         Adjusted date.
@@ -183,55 +289,67 @@ def adjust_business_day(
     if rule == BusinessDayRule.NONE:
         return d
 
-    if is_business_day(d, calendar):
+    holidays = _holiday_set(calendar)
+    if d.weekday() < 5 and d not in holidays:
         return d
 
     if rule == BusinessDayRule.FOLLOWING:
-        adjusted = d
-        while not is_business_day(adjusted, calendar):
-            adjusted += timedelta(days=1)
-        return adjusted
+        return _roll_following(d, holidays)
 
     elif rule == BusinessDayRule.PRECEDING:
-        adjusted = d
-        while not is_business_day(adjusted, calendar):
-            adjusted -= timedelta(days=1)
-        return adjusted
+        return _roll_preceding(d, holidays)
 
     elif rule == BusinessDayRule.MODIFIED_FOLLOWING:
-        adjusted = d
-        original_month = adjusted.month
-
-        # Move forward
-        while not is_business_day(adjusted, calendar):
-            adjusted += timedelta(days=1)
-            # If we've moved to next month, go back
-            if adjusted.month != original_month:
-                adjusted = d
-                while not is_business_day(adjusted, calendar):
-                    adjusted -= timedelta(days=1)
-                break
+        adjusted = _roll_following(d, holidays)
+        # If we've moved to next month, go back
+        if adjusted.month != d.month:
+            adjusted = _roll_preceding(d, holidays)
         return adjusted
 
     elif rule == BusinessDayRule.MODIFIED_PRECEDING:
-        adjusted = d
-        original_month = adjusted.month
-
-        # Move backward
-        while not is_business_day(adjusted, calendar):
-            adjusted -= timedelta(days=1)
-            # If we've moved to previous month, go forward
-            if adjusted.month != original_month:
-                adjusted = d
-                while not is_business_day(adjusted, calendar):
-                    adjusted += timedelta(days=1)
-                break
+        adjusted = _roll_preceding(d, holidays)
+        # If we've moved to previous month, go forward
+        if adjusted.month != d.month:
+            adjusted = _roll_following(d, holidays)
         return adjusted
 
     else:
         raise ValueError(f"Unsupported business day rule: {rule}")
 
 
+def _holiday_set(calendar: Collection[date] | None) -> frozenset[date]:
+    """Holiday calendar as a frozenset, converted at most once per call chain."""
+    if isinstance(calendar, frozenset):
+        return calendar
+    return frozenset(calendar) if calendar else frozenset()
+
+
+def _roll_following(d: date, holidays: frozenset[date]) -> date:
+    """First business day on or after d."""
+    while True:
+        weekday = d.weekday()
+        if weekday >= 5:
+            # Saturday -> +2, Sunday -> +1
+            d += timedelta(days=7 - weekday)
+        elif d in holidays:
+            d += timedelta(days=1)
+        else:
+            return d
+
+
+def _roll_preceding(d: date, holidays: frozenset[date]) -> date:
+    """Last business day on or before d."""
+    while True:
+        weekday = d.weekday()
+        if weekday >= 5:
+            # Saturday -> -1, Sunday -> -2
+            d -= timedelta(days=weekday - 4)
+        elif d in holidays:
+            d -= timedelta(days=1)
+        else:
+            return d
+
+
 def add_months(d: date, months: int) -> date:
     """Add months to a date.
 
@@ -252,7 +370,10 @@ def add_months(d: date, months: int) -> date:
     month = d.month - 1 + months
     year = d.year + month // 12
     month = month % 12 + 1
-    day = min(d.day, _days_in_month(year, month))
+    day = d.day
+    # Every month has at least 28 days, so only later days can need clamping
+    if day > 28:
+        day = min(day, _DAYS_IN_MONTH[_is_leap_year(year)][month])
     return date(year, month, day)
 
 
@@ -271,32 +392,18 @@ def add_years(d: date, years: int) -> date:
         >>> add_years(date(2024, 2, 29), 1)
         datetime.date(2025, 2, 28)
     """
-    try:
-        return date(d.year + years, d.month, d.day)
-    except ValueError:
-        # Handle leap year edge case (Feb 29 -> Feb 28 in non-leap year)
-        return date(d.year + years, d.month, d.day - 1)
+    year = d.year + years
+    # Handle leap year edge case (Feb 29 -> Feb 28 in non-leap year)
+    if d.month == 2 and d.day == 29 and not _is_leap_year(year):
+        return date(year, 2, 28)
+    return date(year, d.month, d.day)
 
 
-def _days_in_month(year: int, month: int) -> int:
-    """Get the number of days in a month.
-
-    Args:
-        year: Year.
-        month: Month (1-12).
-
-    Returns:
-        Number of days in the month.
-    """
-    if month == 2:
-        # February: check for leap year
-        if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
-            return 29
-        return 28
-    elif month in [4, 6, 9, 11]:
-        return 30
-    else:
-        return 31
+# Days per month indexed by [is leap year][month number]
+_DAYS_IN_MONTH: Final = (
+    (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+    (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+)
 
 
 def generate_schedule(
@@ -304,7 +411,7 @@ def generate_schedule(
     end_date: date,
     frequency: str = "6M",
     business_day_rule: BusinessDayRule = BusinessDayRule.MODIFIED_FOLLOWING,
-    calendar: list[date] | None = None,
+    calendar: Collection[date] | None = None,
 ) -> list[date]:
     """Generate a schedule of dates between start and end dates.
 
@@ -313,7 +420,8 @@ def generate_schedule(
         end_date: End date of the schedule.
         frequency: Frequency string (e.g., "1M", "3M", "6M", "1Y"). Defaults to "6M".
         business_day_rule: Business day adjustment rule. Defaults to MODIFIED_FOLLOWING.
-        calendar: List of holidays. If None, only weekends are considered non-business days.
+        calendar: Holidays. If None, only weekends are considered non-business days.
+            Pass a frozenset to skip the per-call set conversion when reusing a calendar.
 
     Returns:
         List of dates in the schedule (including start_date and end_date).
@@ -324,58 +432,194 @@ def generate_schedule(
         >>> len(schedule)
         3
     """
+    # datetime64[D].tolist() yields datetime.date objects without per-date Python calls
+    dates: list[date] = _schedule_dates(
+        start_date, end_date, frequency, business_day_rule, calendar
+    ).tolist()
+    return dates
+
+
+def generate_schedule_ordinals(
+    start_date: date,
+    end_date: date,
+    frequency: str = "6M",
+    business_day_rule: BusinessDayRule = BusinessDayRule.MODIFIED_FOLLOWING,
+    calendar: Collection[date] | None = None,
+) -> np.ndarray:
+    """Generate a schedule as proleptic Gregorian ordinals (`date.toordinal`).
+
+    Same dates as `generate_schedule`, returned as an int64 array for vectorized
+    day counts (see `days_between_vec`).
+
+    Args:
+        start_date: Start date of the schedule.
+        end_date: End date of the schedule.
+        frequency: Frequency string (e.g., "1M", "3M", "6M", "1Y"). Defaults to "6M".
+        business_day_rule: Business day adjustment rule. Defaults to MODIFIED_FOLLOWING.
+        calendar: Holidays. If None, only weekends are considered non-business days.
+
+    Returns:
+        Array of int64 ordinals of the schedule dates.
+    """
+    dates = _schedule_dates(start_date, end_date, frequency, business_day_rule, calendar)
+    return dates.astype(np.int64) + _EPOCH_ORDINAL
+
+
+def _schedule_dates(
+    start_date: date,
+    end_date: date,
+    frequency: str,
+    business_day_rule: BusinessDayRule,
+    calendar: Collection[date] | None,
+) -> np.ndarray:
+    """Schedule dates as a datetime64[D] array (see `generate_schedule`)."""
     if end_date < start_date:
         raise ValueError(f"end_date ({end_date}) must be >= start_date ({start_date})")
 
-    # Parse frequency
-    frequency_value = int(frequency[:-1])
-    frequency_unit = frequency[-1].upper()
+    holidays = _holiday_set(calendar)
+
+    # Generate intermediate dates
+    roll_dates = np.empty(0, dtype="datetime64[D]")
+    if start_date < end_date:
+        step_months = _frequency_months(frequency)
+        roll_dates = _unadjusted_roll_dates(start_date, end_date, step_months)
+
+    # Adjust the start date, the roll dates and the end date in one pass
+    end = np.datetime64(end_date, "D")
+    adjusted = _adjust_business_days(
+        np.concatenate(([np.datetime64(start_date, "D")], roll_dates, [end])),
+        business_day_rule,
+        holidays,
+    )
 
-    schedule: list[date] = []
-    current_date = start_date
+    # Ensure end date is included (adjusted)
+    last = adjusted[-2]
+    if last != end and adjusted[-1] != last:
+        return adjusted
+    return adjusted[:-1]
 
-    # Adjust start date if needed
-    adjusted_start = adjust_business_day(start_date, business_day_rule, calendar)
-    schedule.append(adjusted_start)
 
-    # Generate intermediate dates
-    while current_date < end_date:
+def _frequency_months(frequency: str) -> int:
+    """Months per period of a frequency string such as "3M" or "1Y", memoized."""
+    step_months = _FREQUENCY_MONTHS.get(frequency)
+    if step_months is None:
+        frequency_value = int(frequency[:-1])
+        frequency_unit = frequency[-1].upper()
         if frequency_unit == "M":
-            current_date = add_months(current_date, frequency_value)
+            step_months = frequency_value
         elif frequency_unit == "Y":
-            current_date = add_years(current_date, frequency_value)
+            step_months = 12 * frequency_value
         else:
             raise ValueError(f"Unsupported frequency unit: {frequency_unit}")
+        if step_months <= 0:
+            raise ValueError(f"Frequency must be positive: {frequency}")
+        if len(_FREQUENCY_MONTHS) >= _FREQUENCY_CACHE_SIZE:
+            _FREQUENCY_MONTHS.clear()
+        _FREQUENCY_MONTHS[frequency] = step_months
+    return step_months
 
-        if current_date <= end_date:
-            adjusted_date = adjust_business_day(current_date, business_day_rule, calendar)
-            schedule.append(adjusted_date)
 
-    # Ensure end date is included (adjusted)
-    if schedule[-1] != end_date:
-        adjusted_end = adjust_business_day(end_date, business_day_rule, calendar)
-        if adjusted_end != schedule[-1]:
-            schedule.append(adjusted_end)
+_FREQUENCY_CACHE_SIZE: Final = 64
+_FREQUENCY_MONTHS: Final[dict[str, int]] = {}
 
-    return schedule
 
+def _unadjusted_roll_dates(start_date: date, end_date: date, step_months: int) -> np.ndarray:
+    """Unadjusted roll dates start + k * step (k >= 1) up to end_date as datetime64[D].
 
+    Matches chaining `add_months` from the previous roll date: once a short month clamps
+    the day, later dates keep the clamped day, hence the running minimum.
+    """
+    start_month = start_date.year * 12 + start_date.month - 1
+    end_month = end_date.year * 12 + end_date.month - 1
+    n_rolls = (end_month - start_month) // step_months
+    months = (start_month - 1970 * 12) + step_months * np.arange(1, n_rolls + 1)
+    month_starts = months.astype("datetime64[M]")
+    first_days = month_starts.astype("datetime64[D]")
+    next_firsts = (month_starts + np.timedelta64(1, "M")).astype("datetime64[D]")
+    month_lengths = (next_firsts - first_days).astype(np.int64)
+    days = np.minimum(np.minimum.accumulate(month_lengths), start_date.day)
+    dates: np.ndarray = first_days + (days - 1).astype("timedelta64[D]")
+    return dates[dates <= np.datetime64(end_date, "D")]
+
+
+def _adjust_business_days(
+    dates: np.ndarray, rule: BusinessDayRule, holidays: frozenset[date]
+) -> np.ndarray:
+    """Vectorized `adjust_business_day` over datetime64[D] dates."""
+    if rule == BusinessDayRule.NONE:
+        return dates
+    roll = _BUSDAY_ROLLS.get(rule) if isinstance(rule, BusinessDayRule) else None
+    if roll is None:
+        # Anything else: defer to the scalar rule handling
+        adjusted = [adjust_business_day(d, rule, holidays) for d in dates.tolist()]
+        return np.array(adjusted, dtype="datetime64[D]")
+    rolled: np.ndarray = np.busday_offset(dates, 0, roll=roll, busdaycal=_busday_calendar(holidays))
+    return rolled
+
+
+def _busday_calendar(holidays: frozenset[date]) -> np.busdaycalendar:
+    """NumPy business day calendar for a holiday set, memoized across schedules."""
+    calendar = _BUSDAY_CALENDAR_CACHE.get(holidays)
+    if calendar is None:
+        # Convert via ordinals: NumPy parses date objects slowly
+        ordinals = np.fromiter(
+            (h.toordinal() for h in holidays), dtype=np.int64, count=len(holidays)
+        )
+        calendar = np.busdaycalendar(
+            holidays=(ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+        )
+        if len(_BUSDAY_CALENDAR_CACHE) >= _BUSDAY_CALENDAR_CACHE_SIZE:
+            _BUSDAY_CALENDAR_CACHE.clear()
+        _BUSDAY_CALENDAR_CACHE[holidays] = calendar
+    return calendar
+
+
+_BUSDAY_CALENDAR_CACHE_SIZE: Final = 32
+_BUSDAY_CALENDAR_CACHE: Final[dict[frozenset[date], np.busdaycalendar]] = {}
+
+
+_BusdayRoll = Literal["following", "preceding", "modifiedfollowing", "modifiedpreceding"]
+_BUSDAY_ROLLS: Final[dict[BusinessDayRule, _BusdayRoll]] = {
+    BusinessDayRule.FOLLOWING: "following",
+    BusinessDayRule.PRECEDING: "preceding",
+    BusinessDayRule.MODIFIED_FOLLOWING: "modifiedfollowing",
+    BusinessDayRule.MODIFIED_PRECEDING: "modifiedpreceding",
+}
+
+
+@overload
 def year_fraction(
     start_date: date,
     end_date: date,
+    convention: DayCountConvention | str = ...,
+) -> float: ...
+
+
+@overload
+def year_fraction(
+    start_date: np.ndarray,
+    end_date: np.ndarray,
+    convention: DayCountConvention | str = ...,
+) -> np.ndarray: ...
+
+
+def year_fraction(
+    start_date: date | np.ndarray,
+    end_date: date | np.ndarray,
     convention: DayCountConvention | str = DayCountConvention.ACT_360,
-) -> float:
+) -> float | np.ndarray:
     """Calculate year fraction between two dates.
 
     Convenience function that accepts both DayCountConvention enum and string.
+    Arrays of date ordinals (`date.toordinal`) are dispatched to `days_between_vec`.
 
     Args:
-        start_date: Start date.
-        end_date: End date.
+        start_date: Start date, or array of start date ordinals.
+        end_date: End date, or array of end date ordinals.
         convention: Day count convention (enum or string). Defaults to ACT/360.
 
     Returns:
-        Year fraction.
+        Year fraction, or array of year fractions for ordinal inputs.
 
     Examples:
         >>> from datetime import date
@@ -384,16 +628,59 @@ def year_fraction(
     """
     if isinstance(convention, str):
         # Map string to enum
-        convention_map = {
-            "ACT/360": DayCountConvention.ACT_360,
-            "ACT/365": DayCountConvention.ACT_365,
-            "ACT/ACT": DayCountConvention.ACT_ACT,
-            "ACT/365.25": DayCountConvention.ACT_365_25,
-            "30/360": DayCountConvention.THIRTY_360,
-        }
-        if convention not in convention_map:
+        resolved = _CONVENTIONS_BY_NAME.get(convention)
+        if resolved is None:
             raise ValueError(f"Unsupported day count convention: {convention}")
-        convention = convention_map[convention]
+        convention = resolved
+
+    if isinstance(start_date, date) and isinstance(end_date, date):
+        # Inline the ACT family, the common case in curve building; anything else,
+        # including an end date before the start, goes through days_between
+        denominator = _ACT_DENOMINATORS.get(convention)
+        if denominator is not None:
+            days = end_date.toordinal() - start_date.toordinal()
+            if days >= 0:
+                return days / denominator
+        return days_between(start_date, end_date, convention)
+    return days_between_vec(np.asarray(start_date), np.asarray(end_date), convention)
+
+
+# Day count conventions by their string names, e.g. "ACT/360"
+_CONVENTIONS_BY_NAME: Final[dict[str, DayCountConvention]] = {
+    convention.value: convention for convention in DayCountConvention
+}
+
+
+def year_fractions(
+    start_date: date,
+    end_dates: Sequence[date],
+    convention: DayCountConvention | str = DayCountConvention.ACT_360,
+) -> np.ndarray:
+    """Year fractions from one start date to each of a sequence of end dates.
+
+    Args:
+        start_date: Common start date.
+        end_dates: End dates.
+        convention: Day count convention (enum or string). Defaults to ACT/360.
+
+    Returns:
+        Array of year fractions (float64), one per end date.
+
+    Raises:
+        ValueError: If any end date is before start_date.
+    """
+    if len(end_dates) < _YEAR_FRACTIONS_VEC_MIN_DATES:
+        # Short sequences: per-date calls beat the array setup cost
+        return np.array([year_fraction(start_date, d, convention) for d in end_dates])
+
+    ordinals = np.fromiter((d.toordinal() for d in end_dates), dtype=np.int64, count=len(end_dates))
+    start = start_date.toordinal()
+    early = np.flatnonzero(ordinals < start)
+    if len(early) > 0:
+        end_date = end_dates[early[0]]
+        raise ValueError(f"end_date ({end_date}) must be >= start_date ({start_date})")
+    return year_fraction(np.asarray(start), ordinals, convention)
 
-    return days_between(start_date, end_date, convention)
 
+# Sequence length from which year_fractions converts dates in one vectorized pass
+_YEAR_FRACTIONS_VEC_MIN_DATES: Final = 16
@@ -1,19 +1,23 @@
 """Tests for date_helpers module."""
 
-from datetime import date
+from datetime import date, timedelta
 
+import numpy as np
 import pytest
 
 from montecarlo_ir.utils.date_helpers import (
     DayCountConvention,
     BusinessDayRule,
     days_between,
+    days_between_vec,
     is_business_day,
     adjust_business_day,
     add_months,
     add_years,
     generate_schedule,
+    generate_schedule_ordinals,
     year_fraction,
+    year_fractions,
 )
 
 
@@ -55,7 +59,7 @@ class TestDayCountConvention:
         result = days_between(start, end, DayCountConvention.ACT_ACT)
         # 2023: 214 days / 365 days, 2024: 152 days / 366 days
         expected = 214.0 / 365.0 + 152.0 / 366.0
-        assert abs(result - expected) < 1e-6
+        assert abs(result - expected) < 1e-12
 
     def test_thirty_360(self) -> None:
         """Test 30/360 day count convention."""
@@ -89,7 +93,7 @@ class TestDayCountConvention:
         result = days_between(start, end, DayCountConvention.ACT_ACT)
         # 2022: 365 days / 365, 2023: 365 days / 365, 2024: 0 days (Jan 1 to Jan 1) / 366
         expected = 365.0 / 365.0 + 365.0 / 365.0 + 0.0 / 366.0
-        assert abs(result - expected) < 1e-6
+        assert abs(result - expected) < 1e-12
 
     def test_act_act_multiple_years_with_partial_last_year(self) -> None:
         """Test ACT/ACT across multiple years with partial last year."""
@@ -98,7 +102,49 @@ class TestDayCountConvention:
         result = days_between(start, end, DayCountConvention.ACT_ACT)
         # 2022: 365 days / 365, 2023: 365 days / 365, 2024: 31 days / 366
         expected = 365.0 / 365.0 + 365.0 / 365.0 + 31.0 / 366.0
-        assert abs(result - expected) < 1e-6
+        assert abs(result - expected) < 1e-12
+
+    def test_act_act_across_century_years(self) -> None:
+        """Test ACT/ACT over a 400-year leap cycle with partial first and last years."""
+        start = date(1899, 7, 1)
+        end = date(2301, 3, 1)
+        result = days_between(start, end, DayCountConvention.ACT_ACT)
+        # 1899: 184 days / 365, 1900-2300: 401 whole years, 2301: 59 days / 365
+        expected = 184.0 / 365.0 + 401.0 + 59.0 / 365.0
+        assert abs(result - expected) < 1e-10
+
+    def test_act_act_into_last_supported_year(self) -> None:
+        """Test ACT/ACT up to the last day of year 9999."""
+        start = date(9998, 7, 1)
+        end = date(9999, 12, 31)
+        result = days_between(start, end, DayCountConvention.ACT_ACT)
+        # 9998: 184 days / 365, 9999: 364 days / 365
+        expected = 184.0 / 365.0 + 364.0 / 365.0
+        assert abs(result - expected) < 1e-12
+
+    @pytest.mark.parametrize("convention", list(DayCountConvention))
+    def test_days_between_same_date(self, convention: DayCountConvention) -> None:
+        """Test every convention is dispatched and gives zero for an empty period."""
+        d = date(2024, 2, 29)
+        assert days_between(d, d, convention) == 0.0
+
+    @pytest.mark.parametrize("convention", list(DayCountConvention))
+    def test_days_between_vec_matches_scalar(self, convention: DayCountConvention) -> None:
+        """Test vectorized day counts over ordinals match the scalar function."""
+        starts = [date(2024, 1, 31), date(2023, 3, 15), date(2020, 2, 29), date(2024, 5, 1)]
+        ends = [date(2024, 3, 31), date(2026, 8, 31), date(2024, 2, 28), date(2024, 5, 1)]
+        fractions = days_between_vec(
+            np.array([d.toordinal() for d in starts]),
+            np.array([d.toordinal() for d in ends]),
+            convention,
+        )
+        expected = [days_between(s, e, convention) for s, e in zip(starts, ends)]
+        np.testing.assert_allclose(fractions, expected, rtol=1e-14, atol=1e-14)
+
+    def test_days_between_vec_invalid_date_order(self) -> None:
+        """Test vectorized day counts reject end dates before start dates."""
+        with pytest.raises(ValueError, match="must be >="):
+            days_between_vec(np.array([10, 20]), np.array([15, 19]))
 
     def test_invalid_date_order(self) -> None:
         """Test that invalid date order raises ValueError."""
@@ -191,6 +237,17 @@ class TestBusinessDayAdjustments:
         adjusted = adjust_business_day(holiday, BusinessDayRule.FOLLOWING, calendar)
         assert adjusted == date(2024, 1, 16)  # Tuesday
 
+    def test_adjust_weekend_followed_by_holidays(self) -> None:
+        """Test that rolling past a weekend keeps skipping adjacent holidays."""
+        calendar = [date(2024, 1, 12), date(2024, 1, 15)]  # Friday and Monday
+        saturday = date(2024, 1, 13)
+        assert adjust_business_day(saturday, BusinessDayRule.FOLLOWING, calendar) == date(
+            2024, 1, 16
+        )
+        assert adjust_business_day(saturday, BusinessDayRule.PRECEDING, calendar) == date(
+            2024, 1, 11
+        )
+
     def test_is_business_day_with_calendar_weekday(self) -> None:
         """Test that weekday not in calendar is business day."""
         calendar = [date(2024, 1, 15)]
@@ -254,6 +311,14 @@ class TestDateArithmetic:
         result = add_years(start, 4)  # 2028 is also a leap year
         assert result == date(2028, 2, 29)
 
+    @pytest.mark.parametrize(
+        ("years", "expected"),
+        [(100, date(2100, 2, 28)), (400, date(2400, 2, 29)), (-100, date(1900, 2, 28))],
+    )
+    def test_add_years_leap_day_century(self, years: int, expected: date) -> None:
+        """Test Feb 29 across century years, which are leap only if divisible by 400."""
+        assert add_years(date(2000, 2, 29), years) == expected
+
     def test_add_months_year_boundary(self) -> None:
         """Test adding months across year boundary."""
         start = date(2024, 11, 15)
@@ -346,6 +411,16 @@ class TestScheduleGeneration:
         for schedule_date in schedule:
             assert is_business_day(schedule_date, calendar)
 
+    def test_generate_schedule_reuses_calendar(self) -> None:
+        """Test repeated schedules on one calendar agree, whatever its collection type."""
+        holidays = [date(2024, 2, 1), date(2024, 3, 1), date(2024, 5, 1)]
+        schedules = [
+            generate_schedule(date(2024, 1, 1), date(2024, 6, 1), "1M", calendar=calendar)
+            for calendar in (holidays, frozenset(holidays), tuple(holidays), holidays)
+        ]
+        assert all(schedule == schedules[0] for schedule in schedules)
+        assert schedules[0][1:3] == [date(2024, 2, 2), date(2024, 3, 4)]
+
     def test_generate_schedule_exact_end_date(self) -> None:
         """Test schedule generation when end date matches schedule."""
         start = date(2024, 1, 1)
@@ -368,6 +443,50 @@ class TestScheduleGeneration:
         # Last date should be a business day
         assert is_business_day(schedule[-1])
 
+    @pytest.mark.parametrize("rule", list(BusinessDayRule))
+    def test_generate_schedule_matches_chained_adjustment(self, rule: BusinessDayRule) -> None:
+        """Test schedule dates match chaining add_months and adjusting each roll date."""
+        start = date(2024, 1, 31)
+        end = date(2027, 3, 15)
+        calendar = [date(2024, 4, 30), date(2025, 12, 31), date(2026, 3, 31)]
+        schedule = generate_schedule(
+            start, end, frequency="1M", business_day_rule=rule, calendar=calendar
+        )
+
+        expected = [adjust_business_day(start, rule, calendar)]
+        current = start
+        while True:
+            current = add_months(current, 1)
+            if current > end:
+                break
+            expected.append(adjust_business_day(current, rule, calendar))
+        adjusted_end = adjust_business_day(end, rule, calendar)
+        if adjusted_end != expected[-1]:
+            expected.append(adjusted_end)
+        assert schedule == expected
+
+    @pytest.mark.parametrize("rule", list(BusinessDayRule))
+    def test_generate_schedule_dense_calendar(self, rule: BusinessDayRule) -> None:
+        """Test schedules on a calendar with holiday runs spanning month ends."""
+        run_start = date(2024, 3, 25)
+        calendar = [run_start + timedelta(days=i) for i in range(16)] + [date(2024, 6, 28)]
+        schedule = generate_schedule(
+            date(2024, 1, 1), date(2024, 12, 31), "1M", business_day_rule=rule, calendar=calendar
+        )
+
+        roll_dates = [add_months(date(2024, 1, 1), i) for i in range(12)] + [date(2024, 12, 31)]
+        assert schedule == [adjust_business_day(d, rule, calendar) for d in roll_dates]
+
+    def test_generate_schedule_ordinals(self) -> None:
+        """Test ordinal schedules match the date schedule."""
+        start = date(2024, 1, 31)
+        end = date(2026, 6, 30)
+        ordinals = generate_schedule_ordinals(start, end, frequency="3M")
+        assert ordinals.dtype == np.int64
+        schedule = generate_schedule(start, end, frequency="3M")
+        assert ordinals.tolist() == [d.toordinal() for d in schedule]
+        assert generate_schedule_ordinals(start, start).tolist() == [start.toordinal()]
+
     def test_generate_schedule_invalid_frequency(self) -> None:
         """Test that invalid frequency unit raises ValueError."""
         start = date(2024, 1, 1)
@@ -400,6 +519,12 @@ class TestYearFraction:
         with pytest.raises(ValueError, match="Unsupported day count convention"):
             year_fraction(start, end, "INVALID")
 
+    @pytest.mark.parametrize("convention", list(DayCountConvention))
+    def test_year_fraction_invalid_date_order(self, convention: DayCountConvention) -> None:
+        """Test year_fraction rejects an end date before the start date for every convention."""
+        with pytest.raises(ValueError, match="end_date.*must be >= start_date"):
+            year_fraction(date(2024, 7, 1), date(2024, 1, 1), convention)
+
     def test_year_fraction_all_string_conventions(self) -> None:
         """Test year_fraction with all string convention formats."""
         start = date(2024, 1, 1)
@@ -410,6 +535,39 @@ class TestYearFraction:
             assert result > 0
             assert isinstance(result, float)
 
+    @pytest.mark.parametrize(
+        "convention", ["ACT/360", "ACT/365", "ACT/ACT", "ACT/365.25", "30/360"]
+    )
+    def test_year_fraction_ordinal_arrays(self, convention: str) -> None:
+        """Test year_fraction on ordinal arrays matches the scalar path."""
+        starts = [date(1, 1, 1), date(2023, 12, 31), date(2024, 2, 29), date(9999, 1, 1)]
+        ends = [date(9999, 12, 31), date(2024, 1, 1), date(2028, 2, 29), date(9999, 12, 31)]
+        result = year_fraction(
+            np.array([d.toordinal() for d in starts]),
+            np.array([d.toordinal() for d in ends]),
+            convention,
+        )
+        expected = [year_fraction(s, e, convention) for s, e in zip(starts, ends)]
+        np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-10)
+
+    @pytest.mark.parametrize("n_dates", [3, 40])
+    @pytest.mark.parametrize("convention", ["ACT/365", "ACT/ACT", "30/360"])
+    def test_year_fractions_match_scalar(self, n_dates: int, convention: str) -> None:
+        """Test year_fractions matches year_fraction for short and long date sequences."""
+        start = date(2024, 1, 31)
+        ends = [add_months(start, 7 * i) for i in range(n_dates)]
+        result = year_fractions(start, ends, convention)
+        expected = [year_fraction(start, d, convention) for d in ends]
+        np.testing.assert_allclose(result, expected, rtol=1e-14, atol=1e-14)
+
+    @pytest.mark.parametrize("n_dates", [3, 40])
+    def test_year_fractions_invalid_date_order(self, n_dates: int) -> None:
+        """Test year_fractions rejects end dates before the start date."""
+        start = date(2024, 1, 1)
+        ends = [date(2025, 1, 1)] * (n_dates - 1) + [date(2023, 12, 31)]
+        with pytest.raises(ValueError, match=r"end_date \(2023-12-31\) must be >= start_date"):
+            year_fractions(start, ends)
+
     def test_days_between_unsupported_convention(self) -> None:
         """Test that unsupported convention raises ValueError."""
         start = date(2024, 1, 1)
@@ -1,5 +1,6 @@
 """Tests for HullWhite1F model."""
 
+import pickle
 from datetime import date
 
 import numpy as np
@@ -23,11 +24,10 @@ def build_simple_yield_curve() -> YieldCurve:
     )
 
 
-def build_hull_white_model() -> HullWhite1F:
+def build_hull_white_model(curve: YieldCurve | None = None) -> HullWhite1F:
     """Create a simple Hull-White model for testing."""
-    curve = build_simple_yield_curve()
     return HullWhite1F(
-        yield_curve=curve,
+        yield_curve=curve if curve is not None else build_simple_yield_curve(),
         mean_reversion=0.1,
         volatility=0.01,
         scheme="exact",
@@ -35,25 +35,41 @@ def build_hull_white_model() -> HullWhite1F:
     )
 
 
+@pytest.fixture(scope="module")
+def simple_yield_curve() -> YieldCurve:
+    """Flat yield curve shared across the tests in this module."""
+    return build_simple_yield_curve()
+
+
+@pytest.fixture(scope="module")
+def hw_model(simple_yield_curve: YieldCurve) -> HullWhite1F:
+    """Hull-White model shared across tests that do not inspect its caches."""
+    return build_hull_white_model(simple_yield_curve)
+
+
+@pytest.fixture
+def rng() -> np.random.Generator:
+    """Seeded generator, fresh per test so results do not depend on test order."""
+    return np.random.default_rng(42)
+
+
 class TestHullWhiteConstruction:
     """Tests for HullWhite1F construction and validation."""
 
-    def test_requires_positive_mean_reversion(self) -> None:
+    def test_requires_positive_mean_reversion(self, simple_yield_curve: YieldCurve) -> None:
         """Test that mean reversion must be positive."""
-        curve = build_simple_yield_curve()
         with pytest.raises(ValueError, match="mean_reversion must be positive"):
             HullWhite1F(
-                yield_curve=curve,
+                yield_curve=simple_yield_curve,
                 mean_reversion=-0.1,
                 volatility=0.01,
             )
 
-    def test_requires_positive_volatility(self) -> None:
+    def test_requires_positive_volatility(self, simple_yield_curve: YieldCurve) -> None:
         """Test that volatility must be positive."""
-        curve = build_simple_yield_curve()
         with pytest.raises(ValueError, match="volatility must be positive"):
             HullWhite1F(
-                yield_curve=curve,
+                yield_curve=simple_yield_curve,
                 mean_reversion=0.1,
                 volatility=-0.01,
             )
@@ -62,117 +78,323 @@ class TestHullWhiteConstruction:
 class TestShortRateSimulation:
     """Tests for short rate path simulation."""
 
-    def test_simulate_exact_scheme(self) -> None:
+    def test_simulate_exact_scheme(self, hw_model: HullWhite1F, rng: np.random.Generator) -> None:
         """Test exact simulation scheme."""
-        model = build_hull_white_model()
         times = [0.0, 0.25, 0.5, 1.0]
-        rates = model.simulate_short_rate_path(times)
+        rates = hw_model.simulate_short_rate_path(times, rng=rng)
         assert len(rates) == len(times)
         assert all(r >= 0.0 for r in rates)  # Rates should be reasonable
 
-    def test_simulate_euler_scheme(self) -> None:
+    def test_simulate_euler_scheme(
+        self, simple_yield_curve: YieldCurve, rng: np.random.Generator
+    ) -> None:
         """Test Euler discretization scheme."""
-        curve = build_simple_yield_curve()
         model = HullWhite1F(
-            yield_curve=curve,
+            yield_curve=simple_yield_curve,
             mean_reversion=0.1,
             volatility=0.01,
             scheme="euler",
         )
         times = [0.0, 0.25, 0.5, 1.0]
-        rates = model.simulate_short_rate_path(times)
+        rates = model.simulate_short_rate_path(times, rng=rng)
         assert len(rates) == len(times)
 
-    def test_simulate_with_custom_shocks(self) -> None:
+    @pytest.mark.parametrize(
+        "times", [[0.0, 0.5, 3.0, 4.0], [0.0, 3.0, 6.0, 9.0, 12.0], [0.0, 2.0, 4.0, 8.0]]
+    )
+    def test_simulate_euler_coarse_steps(
+        self, times: list[float], simple_yield_curve: YieldCurve
+    ) -> None:
+        """Test Euler scheme with steps longer than 1/a."""
+        model = HullWhite1F(
+            yield_curve=simple_yield_curve,
+            mean_reversion=0.5,
+            volatility=0.01,
+            scheme="euler",
+        )
+        shocks = np.linspace(0.3, -0.2, len(times) - 1)
+        rates = model.simulate_short_rate_path(times, shocks)
+        # Step by step: r[i] = r[i-1] + (theta - a*r[i-1])*dt + sigma*sqrt(dt)*z
+        thetas = model._theta_values(np.asarray(times))
+        expected = [rates[0]]
+        for i in range(1, len(times)):
+            dt = times[i] - times[i - 1]
+            theta = thetas[i - 1]
+            r_prev = expected[-1]
+            expected.append(
+                r_prev + (theta - 0.5 * r_prev) * dt + 0.01 * np.sqrt(dt) * shocks[i - 1]
+            )
+        np.testing.assert_allclose(rates, expected, rtol=1e-12, atol=1e-14)
+
+    @pytest.mark.parametrize("times", [np.linspace(0.0, 3.0, 13), np.linspace(0.0, 10.0, 5)])
+    def test_simulate_exact_uniform_grid(
+        self, times: np.ndarray, simple_yield_curve: YieldCurve
+    ) -> None:
+        """Test exact scheme on uniform grids against the stepwise solution."""
+        a, sigma = 0.5, 0.01
+        model = HullWhite1F(yield_curve=simple_yield_curve, mean_reversion=a, volatility=sigma)
+        shocks = np.linspace(-1.0, 1.0, len(times) - 1)
+        rates = model.simulate_short_rate_path(times, shocks)
+        theta_integrals = model._theta_integrals(times)
+        expected = [rates[0]]
+        for i in range(1, len(times)):
+            dt = times[i] - times[i - 1]
+            std = np.sqrt(sigma**2 / (2.0 * a) * (1.0 - np.exp(-2.0 * a * dt)))
+            expected.append(
+                np.exp(-a * dt) * expected[-1] + theta_integrals[i - 1] + std * shocks[i - 1]
+            )
+        np.testing.assert_allclose(rates, expected, rtol=1e-12, atol=1e-14)
+
+    def test_theta_table_reused_across_paths(self, simple_yield_curve: YieldCurve) -> None:
+        """Test the Euler theta table is built once per time grid."""
+        model = HullWhite1F(
+            yield_curve=simple_yield_curve,
+            mean_reversion=0.1,
+            volatility=0.01,
+            scheme="euler",
+        )
+        times = np.linspace(0.0, 2.0, 9)
+        thetas = model._theta_values(times)
+        assert len(thetas) == len(times) - 1
+        model.simulate_short_rate_path(times, np.zeros(8))
+        assert len(model._theta_cache) == 1
+        np.testing.assert_array_equal(model._theta_values(times), thetas)
+
+    def test_exact_zero_shock_path_matches_mean(self, simple_yield_curve: YieldCurve) -> None:
+        """Test zero-shock exact paths follow the analytic Hull-White mean."""
+        a, sigma = 0.1, 0.01
+        model = HullWhite1F(yield_curve=simple_yield_curve, mean_reversion=a, volatility=sigma)
+        times = np.linspace(0.0, 4.0, 49)
+        rates = model.simulate_short_rate_path(times, np.zeros(len(times) - 1))
+        forwards = simple_yield_curve.forward_rate_batch(times, times + 1e-6)
+        mean = forwards + sigma**2 / (2.0 * a**2) * (1.0 - np.exp(-a * times)) ** 2
+        np.testing.assert_allclose(rates, mean, atol=1e-3)
+
+    @pytest.mark.parametrize(("s", "t"), [(0.0, 5.0), (0.3, 2.7), (1.1, 1.3)])
+    def test_theta_integral_matches_trapezoid(
+        self, s: float, t: float, hw_model: HullWhite1F
+    ) -> None:
+        """Test closed-form theta integrals against trapezoid rule on the theta table."""
+        taus = np.linspace(s, t, 4001)
+        thetas = hw_model._theta_grid(taus)
+        trapezoid = np.sum(np.diff(taus) * (thetas[1:] + thetas[:-1]) / 2.0)
+        assert hw_model._theta_integral(s, t) == pytest.approx(trapezoid, rel=1e-7)
+
+    def test_simulate_single_time_point(self, hw_model: HullWhite1F) -> None:
+        """Test a one-point grid returns just the initial short rate."""
+        rates = hw_model.simulate_short_rate_path([0.5])
+        assert rates.shape == (1,)
+        assert hw_model._theta_integral(0.5, 0.5) == 0.0
+
+    def test_simulate_with_custom_shocks(self, hw_model: HullWhite1F) -> None:
         """Test simulation with provided random shocks."""
-        model = build_hull_white_model()
         times = [0.0, 0.25, 0.5]
         shocks = np.array([0.5, -0.3])
-        rates1 = model.simulate_short_rate_path(times, shocks)
-        rates2 = model.simulate_short_rate_path(times, shocks)
+        rates1 = hw_model.simulate_short_rate_path(times, shocks)
+        rates2 = hw_model.simulate_short_rate_path(times, shocks)
         # Same shocks should give same results
         np.testing.assert_array_almost_equal(rates1, rates2)
-
-    def test_simulate_invalid_times(self) -> None:
+        # A seeded generator reproduces the batch, whose first path is the single path
+        paths1 = hw_model.simulate_short_rate_paths(times, 3, rng=np.random.default_rng(5))
+        paths2 = hw_model.simulate_short_rate_paths(times, 3, rng=np.random.default_rng(5))
+        np.testing.assert_array_equal(paths1, paths2)
+        path = hw_model.simulate_short_rate_path(times, rng=np.random.default_rng(5))
+        np.testing.assert_array_equal(path, paths1[0])
+
+    def test_simulate_invalid_times(self, hw_model: HullWhite1F) -> None:
         """Test error handling for invalid times."""
-        model = build_hull_white_model()
         with pytest.raises(ValueError, match="must be non-negative"):
-            model.simulate_short_rate_path([-0.1, 0.5])
+            hw_model.simulate_short_rate_path([-0.1, 0.5])
 
         with pytest.raises(ValueError, match="strictly increasing"):
-            model.simulate_short_rate_path([0.5, 0.3])
+            hw_model.simulate_short_rate_path([0.5, 0.3])
 
-    def test_simulate_invalid_shocks_length(self) -> None:
+    def test_simulate_invalid_shocks_length(self, hw_model: HullWhite1F) -> None:
         """Test error when shocks length doesn't match times."""
-        model = build_hull_white_model()
         times = [0.0, 0.25, 0.5]
         shocks = np.array([0.5])  # Wrong length
         with pytest.raises(ValueError, match="must have length"):
-            model.simulate_short_rate_path(times, shocks)
+            hw_model.simulate_short_rate_path(times, shocks)
+
+    def test_simulate_accepts_list_shocks(self, hw_model: HullWhite1F) -> None:
+        """Test shocks given as a list are converted like the times."""
+        times = [0.0, 0.25, 0.5]
+        np.testing.assert_array_equal(
+            hw_model.simulate_short_rate_path(times, [0.3, -0.4]),
+            hw_model.simulate_short_rate_path(np.array(times), np.array([0.3, -0.4])),
+        )
+
+
+class TestPathBatches:
+    """Tests for batched path simulation."""
+
+    @pytest.mark.parametrize("scheme", ["exact", "euler"])
+    def test_paths_match_single_path(
+        self, scheme: str, simple_yield_curve: YieldCurve, rng: np.random.Generator
+    ) -> None:
+        """Test each batched path equals the single-path simulation."""
+        model = HullWhite1F(
+            yield_curve=simple_yield_curve, mean_reversion=0.1, volatility=0.01, scheme=scheme
+        )
+        times = [0.0, 0.25, 0.5, 1.0]
+        shocks = rng.standard_normal((5, 3))
+        paths = model.simulate_short_rate_paths(times, 5, shocks)
+        assert paths.shape == (5, 4)
+        for path, path_shocks in zip(paths, shocks):
+            np.testing.assert_allclose(
+                path, model.simulate_short_rate_path(times, path_shocks), rtol=1e-13
+            )
+
+    def test_paths_generate_shocks(self, hw_model: HullWhite1F) -> None:
+        """Test batched simulation draws its own shocks."""
+        paths = hw_model.simulate_short_rate_paths([0.0, 0.5, 1.0], 3)
+        assert paths.shape == (3, 3)
+        assert np.all(paths[:, 0] == paths[0, 0])
+
+    def test_paths_reproducible_with_generator(self, hw_model: HullWhite1F) -> None:
+        """Test an injected generator draws all shocks in one reproducible call."""
+        times = [0.0, 0.5, 1.0, 1.5]
+        paths = hw_model.simulate_short_rate_paths(times, 4, rng=np.random.default_rng(11))
+        shocks = np.random.default_rng(11).standard_normal((4, 3))
+        np.testing.assert_array_equal(paths, hw_model.simulate_short_rate_paths(times, 4, shocks))
+        path = hw_model.simulate_short_rate_path(times, rng=np.random.default_rng(11))
+        np.testing.assert_array_equal(path, hw_model.simulate_short_rate_path(times, shocks[0]))
+
+    @pytest.mark.parametrize(
+        ("scheme", "a", "n_steps"), [("exact", 5.0, 3000), ("euler", 2.0, 333)]
+    )
+    def test_paths_long_horizon(
+        self,
+        scheme: str,
+        a: float,
+        n_steps: int,
+        simple_yield_curve: YieldCurve,
+        rng: np.random.Generator,
+    ) -> None:
+        """Test paths stay finite when the cumulative decay underflows over the grid."""
+        model = HullWhite1F(
+            yield_curve=simple_yield_curve, mean_reversion=a, volatility=0.01, scheme=scheme
+        )
+        times = np.linspace(0.0, 150.0, n_steps + 1)
+        shocks = rng.standard_normal((2, n_steps))
+        paths = model.simulate_short_rate_paths(times, 2, shocks)
+        assert np.all(np.isfinite(paths))
+        dt = times[1] - times[0]
+        if scheme == "exact":
+            decay = np.exp(-a * dt)
+            std = np.sqrt(0.01**2 / (2.0 * a) * (1.0 - np.exp(-2.0 * a * dt)))
+            increments = model._theta_integrals(times) + std * shocks
+        else:
+            decay = 1.0 - a * dt
+            increments = model._theta_values(times) * dt + 0.01 * np.sqrt(dt) * shocks
+        expected = np.empty_like(paths)
+        expected[:, 0] = paths[:, 0]
+        for i in range(1, len(times)):
+            expected[:, i] = decay * expected[:, i - 1] + increments[:, i - 1]
+        np.testing.assert_allclose(paths, expected, rtol=1e-10, atol=1e-14)
+
+    def test_paths_invalid_inputs(self, hw_model: HullWhite1F) -> None:
+        """Test error handling for batched simulation."""
+        with pytest.raises(ValueError, match="n_paths must be positive"):
+            hw_model.simulate_short_rate_paths([0.0, 0.5], 0)
+        with pytest.raises(ValueError, match="must have shape"):
+            hw_model.simulate_short_rate_paths([0.0, 0.5, 1.0], 2, np.zeros((2, 3)))
 
 
 class TestBondPricing:
     """Tests for bond price calculations."""
 
-    def test_bond_price_at_maturity(self) -> None:
+    def test_bond_price_at_maturity(self, hw_model: HullWhite1F) -> None:
         """Test bond price equals 1 at maturity."""
-        model = build_hull_white_model()
         t = 1.0
         T = 1.0
         r_t = 0.02
-        price = model.bond_price(t, T, r_t)
+        price = hw_model.bond_price(t, T, r_t)
         assert abs(price - 1.0) < 1e-10
 
-    def test_bond_price_positive(self) -> None:
+    def test_bond_price_positive(self, hw_model: HullWhite1F) -> None:
         """Test bond prices are positive."""
-        model = build_hull_white_model()
         t = 0.0
         T = 1.0
         r_t = 0.02
-        price = model.bond_price(t, T, r_t)
+        price = hw_model.bond_price(t, T, r_t)
         assert price > 0.0
         assert price <= 1.0
 
-    def test_bond_price_decreasing_in_rate(self) -> None:
+    def test_bond_price_decreasing_in_rate(self, hw_model: HullWhite1F) -> None:
         """Test bond price decreases as rate increases."""
-        model = build_hull_white_model()
         t = 0.0
         T = 1.0
-        price_low = model.bond_price(t, T, 0.01)
-        price_high = model.bond_price(t, T, 0.03)
+        price_low = hw_model.bond_price(t, T, 0.01)
+        price_high = hw_model.bond_price(t, T, 0.03)
         assert price_low > price_high
 
-    def test_bond_price_invalid_times(self) -> None:
+    def test_bond_price_invalid_times(self, hw_model: HullWhite1F) -> None:
         """Test error handling for invalid times."""
-        model = build_hull_white_model()
         with pytest.raises(ValueError, match="must be >= current time"):
-            model.bond_price(1.0, 0.5, 0.02)
+            hw_model.bond_price(1.0, 0.5, 0.02)
 
         with pytest.raises(ValueError, match="must be non-negative"):
-            model.bond_price(-0.1, 1.0, 0.02)
+            hw_model.bond_price(-0.1, 1.0, 0.02)
 
-    def test_discount_factor_equals_bond_price(self) -> None:
-        """Test discount factor equals bond price."""
+    def test_market_discount_factors_reused(self) -> None:
+        """Test market discount factors are looked up once per time point."""
+        model = build_hull_white_model()
+        prices = [model.bond_price(0.5, 2.0, r) for r in (0.01, 0.02, 0.03)]
+        assert prices[0] > prices[1] > prices[2]
+        assert set(model._df_cache) == {0.5, 2.0}
+        assert model._df_cache[2.0] == model.yield_curve.discount_factor(date(2025, 12, 31))
+
+    def test_bond_price_coefficients_keyed_on_rounded_times(self) -> None:
+        """Test times that differ only by float rounding share cached coefficients."""
         model = build_hull_white_model()
+        price = model.bond_price(0.3, 1.3, 0.02)
+        assert model.bond_price(0.1 + 0.2, 1.1 + 0.2, 0.02) == price
+        assert len(model._ab_cache) == 1
+
+    def test_bond_prices_over_paths(self, hw_model: HullWhite1F) -> None:
+        """Test vectorized bond prices match scalar pricing per short rate."""
+        r_paths = np.array([[0.01, 0.02], [0.03, -0.005]])
+        prices = hw_model.bond_prices_over_paths(0.5, 2.0, r_paths)
+        assert prices.shape == r_paths.shape
+        expected = [[hw_model.bond_price(0.5, 2.0, r) for r in row] for row in r_paths.tolist()]
+        np.testing.assert_allclose(prices, expected, rtol=1e-15)
+        np.testing.assert_array_equal(hw_model.bond_prices_over_paths(1.0, 1.0, r_paths), 1.0)
+        with pytest.raises(ValueError, match="must be >= current time"):
+            hw_model.bond_prices_over_paths(2.0, 1.0, r_paths)
+
+    def test_discount_factor_equals_bond_price(self, hw_model: HullWhite1F) -> None:
+        """Test discount factor equals bond price."""
         t = 0.0
         T = 1.0
         r_t = 0.02
-        df = model.discount_factor(t, T, r_t)
-        price = model.bond_price(t, T, r_t)
+        df = hw_model.discount_factor(t, T, r_t)
+        price = hw_model.bond_price(t, T, r_t)
         assert abs(df - price) < 1e-10
 
 
 class TestModelProperties:
-    """Tests for model properties and behavior."""
+    """Tests for hw_model properties and behavior."""
+
+    @pytest.mark.parametrize("scheme", ["exact", "euler"])
+    def test_pickle_round_trip(self, simple_yield_curve: YieldCurve, scheme: str) -> None:
+        """Test the model pickles and the copy simulates identical paths."""
+        model = HullWhite1F(
+            yield_curve=simple_yield_curve, mean_reversion=0.1, volatility=0.01, scheme=scheme
+        )
+        times = [0.0, 0.5, 1.0, 2.0]
+        shocks = np.array([0.3, -1.2, 0.8])
+        expected = model.simulate_short_rate_path(times, shocks)
+        restored = pickle.loads(pickle.dumps(model))
+        np.testing.assert_array_equal(restored.simulate_short_rate_path(times, shocks), expected)
 
-    def test_mean_reversion_effect(self) -> None:
+    def test_mean_reversion_effect(self, simple_yield_curve: YieldCurve) -> None:
         """Test that higher mean reversion leads to faster mean reversion."""
-        curve = build_simple_yield_curve()
         model_low = HullWhite1F(
-            yield_curve=curve, mean_reversion=0.05, volatility=0.01, scheme="exact"
+            yield_curve=simple_yield_curve, mean_reversion=0.05, volatility=0.01, scheme="exact"
         )
         model_high = HullWhite1F(
-            yield_curve=curve, mean_reversion=0.2, volatility=0.01, scheme="exact"
+            yield_curve=simple_yield_curve, mean_reversion=0.2, volatility=0.01, scheme="exact"
         )
 
         times = [0.0, 1.0, 2.0]
@@ -184,14 +406,13 @@ class TestModelProperties:
         assert len(rates_low) == len(times)
         assert len(rates_high) == len(times)
 
-    def test_volatility_effect(self) -> None:
+    def test_volatility_effect(self, simple_yield_curve: YieldCurve) -> None:
         """Test that higher volatility leads to more variation."""
-        curve = build_simple_yield_curve()
         model_low = HullWhite1F(
-            yield_curve=curve, mean_reversion=0.1, volatility=0.005, scheme="exact"
+            yield_curve=simple_yield_curve, mean_reversion=0.1, volatility=0.005, scheme="exact"
         )
         model_high = HullWhite1F(
-            yield_curve=curve, mean_reversion=0.1, volatility=0.02, scheme="exact"
+            yield_curve=simple_yield_curve, mean_reversion=0.1, volatility=0.02, scheme="exact"
         )
 
         times = [0.0, 0.5, 1.0]
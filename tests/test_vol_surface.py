@@ -2,6 +2,7 @@
 
 from datetime import date
 
+import numpy as np
 import pytest
 
 from montecarlo_ir.market_data.vol_surface import (
@@ -72,6 +73,14 @@ class TestVolatilitySurfaceConstruction:
                 volatility_matrix=((0.2,),),  # Only 1 column, need 2
             )
 
+        with pytest.raises(ValueError, match="row 1 must have 2 columns"):
+            VolatilitySurface(
+                valuation_date=date(2024, 1, 1),
+                expiry_times=(1.0, 2.0),
+                tenor_times=(1.0, 2.0),
+                volatility_matrix=((0.2, 0.21), (0.22,)),  # Ragged second row
+            )
+
     def test_volatilities_must_be_non_negative(self) -> None:
         """Test that volatilities must be non-negative."""
         with pytest.raises(ValueError, match="must be non-negative"):
@@ -92,6 +101,14 @@ class TestVolatilitySurfaceConstruction:
                 volatility_matrix=((0.2,), (0.2,)),
             )
 
+        with pytest.raises(ValueError, match="strictly increasing"):
+            VolatilitySurface(
+                valuation_date=date(2024, 1, 1),
+                expiry_times=(1.0,),
+                tenor_times=(1.0, float("nan"), 3.0),  # NaN breaks the ordering
+                volatility_matrix=((0.2, 0.2, 0.2),),
+            )
+
 
 class TestVolatilityQueries:
     """Tests for volatility queries."""
@@ -103,6 +120,34 @@ class TestVolatilityQueries:
         vol = surface.volatility_at_times(0.25, 0.25)
         assert abs(vol - 0.15) < 1e-10
 
+    def test_float32_storage(self) -> None:
+        """Test float32 storage matches float64 to single precision."""
+        surface64 = build_simple_surface()
+        surface32 = VolatilitySurface(
+            valuation_date=surface64.valuation_date,
+            expiry_times=surface64.expiry_times,
+            tenor_times=surface64.tenor_times,
+            volatility_matrix=surface64.volatility_matrix,
+            dtype="float32",
+        )
+        assert abs(surface32.volatility_at_times(0.375, 0.375) - 0.16) < 1e-6
+        exp = np.array([0.25, 0.375, 0.75, 5.0])
+        ten = np.array([0.25, 0.375, 1.0, 10.0])
+        batch32 = surface32.volatility_batch(exp, ten)
+        assert batch32.dtype == np.float32
+        np.testing.assert_allclose(batch32, surface64.volatility_batch(exp, ten), atol=1e-6)
+
+    def test_invalid_dtype(self) -> None:
+        """Test unsupported storage dtype raises error."""
+        with pytest.raises(ValueError, match="Unsupported dtype"):
+            VolatilitySurface(
+                valuation_date=date(2024, 1, 1),
+                expiry_times=(0.25,),
+                tenor_times=(1.0,),
+                volatility_matrix=((0.2,),),
+                dtype="float16",  # type: ignore[arg-type]
+            )
+
     def test_volatility_interpolation(self) -> None:
         """Test linear interpolation between grid points."""
         surface = build_simple_surface()
@@ -123,6 +168,18 @@ class TestVolatilityQueries:
         vol_low = surface.volatility_at_times(0.1, 1.0)
         assert vol_low > 0.0
 
+    def test_volatility_extrapolation_flat_clamps_to_edges(self) -> None:
+        """Test flat extrapolation returns the edge values of the grid on both axes."""
+        surface = build_simple_surface()
+        assert surface.volatility_at_times(0.1, 0.1) == 0.15
+        assert surface.volatility_at_times(5.0, 10.0) == 0.22
+        assert surface.volatility_at_times(0.1, 10.0) == 0.19
+        assert surface.volatility_at_times(5.0, 0.1) == 0.18
+        np.testing.assert_array_equal(
+            surface.volatility_batch([0.1, 5.0, 0.1, 5.0], [0.1, 10.0, 10.0, 0.1]),
+            [0.15, 0.22, 0.19, 0.18],
+        )
+
     def test_volatility_extrapolation_linear(self) -> None:
         """Test linear extrapolation."""
         surface = VolatilitySurface(
@@ -145,6 +202,30 @@ class TestVolatilityQueries:
         vol = surface.volatility(expiry_date, 1.0)
         assert vol > 0.0
 
+    def test_volatility_from_dates_memoizes_times(self) -> None:
+        """Test repeated date queries reuse the memoized expiry time."""
+        surface = build_simple_surface()
+        expiry_date = date(2024, 4, 1)
+        first = surface.volatility(expiry_date, 1.0)
+        assert surface.volatility(expiry_date, 2.0) == surface.volatility_at_times(
+            surface._t_cache[expiry_date], 2.0
+        )
+        assert surface.volatility(expiry_date, 1.0) == first
+
+    def test_volatility_at_times_memoizes_results(self) -> None:
+        """Test repeated scalar queries are served from the query cache."""
+        surface = build_simple_surface()
+        first = surface.volatility_at_times(0.375, 0.375)
+        assert surface._query_cache[(0.375, 0.375)] == first
+        assert surface.volatility_at_times(0.375, 0.375) == first
+        surface.invalidate_cache()
+        assert surface._query_cache == {}
+        assert surface.volatility_at_times(0.375, 0.375) == first
+        # Invalid queries are never cached and keep raising
+        for _ in range(2):
+            with pytest.raises(ValueError, match="non-negative"):
+                surface.volatility_at_times(-1.0, 1.0)
+
     def test_volatility_invalid_expiry_date(self) -> None:
         """Test error when expiry date is before valuation date."""
         surface = build_simple_surface()
@@ -160,6 +241,99 @@ class TestVolatilityQueries:
             surface.volatility_at_times(1.0, -0.1)
 
 
+class TestBatchQueries:
+    """Tests for vectorized volatility queries."""
+
+    def test_volatility_batch_matches_scalar(self) -> None:
+        """Test batch queries agree with scalar queries across the grid and beyond."""
+        surface = build_simple_surface()
+        expiries = np.array([0.0, 0.1, 0.25, 0.375, 0.75, 2.0, 5.0])
+        tenors = np.array([0.0, 0.25, 0.375, 1.5, 5.0, 10.0, 0.3])
+        vols = surface.volatility_batch(expiries, tenors)
+        assert vols.shape == expiries.shape
+        for e, t, v in zip(expiries, tenors, vols):
+            assert abs(v - surface.volatility_at_times(e, t)) < 1e-15
+
+    @pytest.mark.parametrize("interpolation", ["linear", "flat"])
+    @pytest.mark.parametrize("extrapolation", ["flat", "linear"])
+    def test_volatility_batch_matches_scalar_all_modes(
+        self, interpolation: str, extrapolation: str
+    ) -> None:
+        """Test batch and scalar queries agree on a dense grid for every mode."""
+        base = build_simple_surface()
+        surface = VolatilitySurface(
+            valuation_date=base.valuation_date,
+            expiry_times=base.expiry_times,
+            tenor_times=base.tenor_times,
+            volatility_matrix=base.volatility_matrix,
+            interpolation=interpolation,
+            extrapolation=extrapolation,
+        )
+        expiries, tenors = np.meshgrid(np.linspace(0.0, 3.0, 25), np.linspace(0.0, 6.0, 25))
+        vols = surface.volatility_batch(expiries, tenors)
+        expected = [
+            surface.volatility_at_times(e, t) for e, t in zip(expiries.ravel(), tenors.ravel())
+        ]
+        np.testing.assert_allclose(vols.ravel(), expected, rtol=0.0, atol=1e-15)
+
+    @pytest.mark.parametrize("n_exp", [2, 3, 4])
+    @pytest.mark.parametrize("n_ten", [2, 3, 4])
+    def test_volatility_batch_matches_scalar_small_grids(self, n_exp: int, n_ten: int) -> None:
+        """Test scalar queries on grids at and above the linear-scan size agree with batch."""
+        surface = VolatilitySurface(
+            valuation_date=date(2024, 1, 1),
+            expiry_times=tuple(0.5 * (i + 1) for i in range(n_exp)),
+            tenor_times=tuple(float(j + 1) for j in range(n_ten)),
+            volatility_matrix=tuple(
+                tuple(0.2 + 0.01 * i + 0.003 * j * j for j in range(n_ten)) for i in range(n_exp)
+            ),
+        )
+        expiries, tenors = np.meshgrid(
+            np.linspace(0.5, 0.5 * n_exp, 17), np.linspace(1.0, float(n_ten), 17)
+        )
+        vols = surface.volatility_batch(expiries, tenors)
+        expected = [
+            surface.volatility_at_times(e, t) for e, t in zip(expiries.ravel(), tenors.ravel())
+        ]
+        np.testing.assert_allclose(vols.ravel(), expected, rtol=0.0, atol=1e-15)
+
+    def test_volatility_batch_linear_extrapolation(self) -> None:
+        """Test batch queries with linear extrapolation and broadcast tenor."""
+        surface = VolatilitySurface(
+            valuation_date=date(2024, 1, 1),
+            expiry_times=(1.0, 2.0),
+            tenor_times=(1.0, 2.0),
+            volatility_matrix=((0.2, 0.21), (0.22, 0.23)),
+            extrapolation="linear",
+        )
+        vols = surface.volatility_batch(np.array([0.5, 1.5, 3.0]), 1.0)
+        np.testing.assert_allclose(vols, [0.19, 0.21, 0.24])
+
+    def test_volatility_at_times_array_input(self) -> None:
+        """Test array inputs to volatility_at_times are dispatched to the batch query."""
+        surface = build_simple_surface()
+        expiries = np.array([0.1, 0.375, 2.0])
+        vols = surface.volatility_at_times(expiries, 1.5)
+        np.testing.assert_array_equal(vols, surface.volatility_batch(expiries, 1.5))
+
+    def test_volatility_at_times_list_and_0d_input(self) -> None:
+        """Test lists dispatch to the batch query and 0-d arrays are scalar queries."""
+        surface = build_simple_surface()
+        vols = surface.volatility_at_times([1.5, 1.2], [1.5, 1.2])
+        np.testing.assert_array_equal(
+            vols, surface.volatility_batch(np.array([1.5, 1.2]), np.array([1.5, 1.2]))
+        )
+        assert surface.volatility_at_times(np.array(0.375), 1) == surface.volatility_at_times(
+            0.375, 1.0
+        )
+
+    def test_volatility_batch_invalid_times(self) -> None:
+        """Test error when any batch time is negative."""
+        surface = build_simple_surface()
+        with pytest.raises(ValueError, match="must be non-negative"):
+            surface.volatility_batch(np.array([0.5, -0.1]), np.array([1.0, 1.0]))
+
+
 class TestBuildHelpers:
     """Tests for build helper functions."""
 
@@ -1,7 +1,9 @@
 """Tests for YieldCurve."""
 
-from datetime import date
+from datetime import date, timedelta
 import math
+
+import numpy as np
 import pytest
 
 from montecarlo_ir.market_data.yield_curve import (
@@ -11,7 +13,7 @@ from montecarlo_ir.market_data.yield_curve import (
     build_yield_curve_from_deposits_simple,
     build_yield_curve_from_swaps,
 )
-from montecarlo_ir.utils.date_helpers import DayCountConvention
+from montecarlo_ir.utils.date_helpers import DayCountConvention, year_fraction
 
 
 def build_simple_curve() -> YieldCurve:
@@ -53,6 +55,23 @@ class TestYieldCurveConstruction:
                 pillar_zero_rates=(0.02,),
             )
 
+    def test_unsorted_pillars_are_sorted(self) -> None:
+        curve = YieldCurve(
+            valuation_date=date(2024, 1, 1),
+            pillar_dates=(date(2026, 1, 1), date(2025, 1, 1)),
+            pillar_zero_rates=(0.025, 0.02),
+        )
+        assert curve.pillar_dates == (date(2025, 1, 1), date(2026, 1, 1))
+        assert curve.pillar_zero_rates == (0.02, 0.025)
+
+    def test_duplicate_pillar_dates_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            YieldCurve(
+                valuation_date=date(2024, 1, 1),
+                pillar_dates=(date(2025, 1, 1), date(2025, 1, 1)),
+                pillar_zero_rates=(0.02, 0.025),
+            )
+
 
 class TestDiscountFactors:
     def test_df_at_valuation_is_one(self) -> None:
@@ -89,6 +108,17 @@ class TestForwardRates:
         fwd = curve.forward_rate(date(2025, 1, 1), date(2026, 1, 1))
         assert fwd > 0.0
 
+    def test_forward_consistent_with_discount_factors(self) -> None:
+        curve = build_simple_curve()
+        for start, end in [
+            (date(2024, 1, 1), date(2024, 1, 2)),
+            (date(2024, 6, 30), date(2025, 7, 2)),
+            (date(2026, 6, 1), date(2029, 1, 1)),
+        ]:
+            tau = year_fraction(start, end, curve.day_count)
+            expected = (curve.discount_factor(start) / curve.discount_factor(end) - 1.0) / tau
+            assert abs(curve.forward_rate(start, end) - expected) < 1e-12
+
     def test_forward_invalid_period(self) -> None:
         curve = build_simple_curve()
         with pytest.raises(ValueError):
@@ -97,7 +127,128 @@ class TestForwardRates:
             curve.forward_rate(date(2026, 1, 1), date(2025, 1, 1))
 
 
+class TestBatchQueries:
+    def test_batch_matches_scalar(self) -> None:
+        curve = build_simple_curve()
+        dates = [date(2024, 1, 1), date(2024, 6, 30), date(2025, 1, 1), date(2025, 7, 2), date(2028, 1, 1)]
+        ts = np.array([curve._time_from_valuation(d) for d in dates])
+        dfs = curve.discount_factor_batch(ts)
+        zeros = curve.zero_rate_at_times(ts)
+        for d, df, z in zip(dates, dfs, zeros):
+            assert abs(df - curve.discount_factor(d)) < 1e-15
+            assert abs(z - curve.zero_rate(d)) < 1e-15
+
+    def test_batch_matches_scalar_across_extrapolation(self) -> None:
+        curve = build_simple_curve()
+        ts = np.linspace(0.0, 10.0, 40).reshape(8, 5)
+        dfs = curve.discount_factor_batch(ts)
+        assert dfs.shape == ts.shape
+        for t, df in zip(ts.ravel(), dfs.ravel()):
+            assert abs(df - curve.discount_factor_t(t)) < 1e-15
+
+    @pytest.mark.parametrize("n_pillars", [2, 12])
+    @pytest.mark.parametrize("interpolation", ["linear_zero", "log_linear_df"])
+    def test_scalar_matches_batch_by_pillar_count(self, n_pillars: int, interpolation: str) -> None:
+        """Scalar lookups scan tiny curves and bisect larger ones; both match the batch path."""
+        curve = build_yield_curve_from_zero_rates(
+            date(2024, 1, 1),
+            [date(2025 + 2 * i, 1, 1) for i in range(n_pillars)],
+            [0.02 + 0.001 * i for i in range(n_pillars)],
+            interpolation=interpolation,
+        )
+        ts = np.linspace(0.0, 2.0 * n_pillars + 2.0, 97)
+        dfs = curve.discount_factor_batch(ts)
+        zeros = curve.zero_rate_at_times(ts)
+        for t, df, z in zip(ts, dfs, zeros):
+            assert abs(df - curve.discount_factor_t(t)) < 1e-15
+            assert abs(z - curve.zero_rate_t(t)) < 1e-15
+
+    def test_discount_factor_many_matches_scalar(self) -> None:
+        curve = build_simple_curve()
+        dates = [date(2025, 7, 2), date(2024, 1, 1), date(2025, 7, 2), date(2026, 3, 1)]
+        dfs = curve.discount_factor_many(dates)
+        assert dfs[0] == dfs[2]
+        for d, df in zip(dates, dfs):
+            assert abs(df - curve.discount_factor(d)) < 1e-15
+        with pytest.raises(ValueError):
+            curve.discount_factor_many([date(2023, 12, 31)])
+
+    @pytest.mark.parametrize("interpolation", ["linear_zero", "log_linear_df"])
+    def test_zero_rate_many_matches_scalar(self, interpolation: str) -> None:
+        curve = build_yield_curve_from_zero_rates(
+            date(2024, 1, 1),
+            (date(2025, 1, 1), date(2026, 1, 1), date(2027, 1, 1)),
+            (0.02, 0.022, 0.025),
+            interpolation=interpolation,
+        )
+        dates = [date(2024, 1, 1) + timedelta(days=37 * i) for i in range(40)]
+        zeros = curve.zero_rate_many(dates)
+        assert zeros.shape == (40,)
+        for d, z in zip(dates, zeros):
+            assert abs(z - curve.zero_rate(d)) < 1e-15
+        with pytest.raises(ValueError, match="on or after valuation_date"):
+            curve.zero_rate_many([date(2025, 1, 1), date(2023, 12, 31)])
+
+    def test_batch_rejects_negative_times(self) -> None:
+        curve = build_simple_curve()
+        with pytest.raises(ValueError):
+            curve.discount_factor_batch(np.array([0.5, -0.1]))
+
+    def test_forward_rate_batch_matches_scalar(self) -> None:
+        curve = build_simple_curve()
+        periods = [
+            (date(2024, 1, 1), date(2024, 7, 1)),
+            (date(2024, 7, 1), date(2025, 7, 2)),
+            (date(2025, 7, 2), date(2030, 1, 1)),
+        ]
+        starts = [curve._time_from_valuation(s) for s, _ in periods]
+        ends = [curve._time_from_valuation(e) for _, e in periods]
+        fwds = curve.forward_rate_batch(starts, ends)
+        for (s, e), f in zip(periods, fwds):
+            assert abs(f - curve.forward_rate(s, e)) < 1e-14
+        with pytest.raises(ValueError):
+            curve.forward_rate_batch([1.0], [1.0])
+
+    def test_time_queries_match_date_queries(self) -> None:
+        curve = build_simple_curve()
+        for d in [date(2024, 1, 1), date(2024, 6, 30), date(2025, 7, 2), date(2028, 1, 1)]:
+            t = curve._time_from_valuation(d)
+            assert curve.discount_factor_t(t) == curve.discount_factor(d)
+            assert curve.zero_rate_t(t) == curve.zero_rate(d)
+        s, e = date(2024, 7, 1), date(2025, 7, 2)
+        fwd = curve.forward_rate_t(curve._time_from_valuation(s), curve._time_from_valuation(e))
+        assert abs(fwd - curve.forward_rate(s, e)) < 1e-14
+        with pytest.raises(ValueError):
+            curve.discount_factor_t(-0.1)
+        with pytest.raises(ValueError):
+            curve.forward_rate_t(1.0, 1.0)
+
+    def test_memos_are_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from montecarlo_ir.market_data import yield_curve
+
+        monkeypatch.setattr(yield_curve, "_MAX_CACHE_SIZE", 4)
+        curve = build_simple_curve()
+        dates = [date(2024, m, 15) for m in range(1, 13)]
+        first = [curve.discount_factor(d) for d in dates]
+        assert len(curve._df_cache) <= 4
+        assert len(curve._t_cache) <= 4
+        assert [curve.discount_factor(d) for d in dates] == first
+
+
 class TestInterpolationModes:
+    @pytest.mark.parametrize("interpolation", ["linear_zero", "log_linear_df"])
+    def test_single_pillar_curve_is_flat(self, interpolation: str) -> None:
+        curve = build_yield_curve_from_zero_rates(
+            date(2024, 1, 1), (date(2025, 1, 1),), (0.03,), interpolation=interpolation
+        )
+        ts = np.array([0.0, 0.5, 1.0, 7.5])
+        np.testing.assert_array_equal(curve.zero_rate_at_times(ts), 0.03)
+        np.testing.assert_allclose(curve.discount_factor_batch(ts), np.exp(-0.03 * ts), rtol=1e-15)
+        for t in ts:
+            assert curve.zero_rate_t(t) == 0.03
+            assert abs(curve.discount_factor_t(t) - math.exp(-0.03 * t)) < 1e-15
+        assert abs(curve.forward_rate_t(2.0, 3.0) - math.expm1(0.03)) < 1e-15
+
     def test_linear_zero_mode(self) -> None:
         val = date(2024, 1, 1)
         pillars = (date(2025, 1, 1), date(2026, 1, 1))
@@ -132,10 +283,11 @@ class TestBootstrappingHelpers:
         r1 = curve.zero_rate(pillars[0])
         r2 = curve.zero_rate(pillars[1])
         # Expected from DF and actual ACT/365 year fractions
-        from montecarlo_ir.utils.date_helpers import year_fraction
-
-        t1 = year_fraction(val, pillars[0], DayCountConvention.ACT_365)
-        t2 = year_fraction(val, pillars[1], DayCountConvention.ACT_365)
+        t1, t2 = curve.pillar_year_fractions
+        assert t1 == year_fraction(val, pillars[0], DayCountConvention.ACT_365)
+        assert t2 == year_fraction(val, pillars[1], DayCountConvention.ACT_365)
+        with pytest.raises(ValueError):
+            curve.pillar_year_fractions[0] = 0.0
         exp_r1 = -math.log(dfs[0]) / t1
         exp_r2 = -math.log(dfs[1]) / t2
         assert abs(r1 - exp_r1) < 1e-10
@@ -173,6 +325,17 @@ class TestBootstrappingHelpers:
         r1 = curve.zero_rate(maturities[0])
         assert 0.018 < r1 < 0.022
 
+    def test_build_from_deposits_simple_overnight_precision(self) -> None:
+        val = date(2024, 1, 1)
+        maturity = (date(2024, 1, 2),)
+        t = 1.0 / 365.0
+        cont = build_yield_curve_from_deposits_simple(val, maturity, (0.0531,))
+        assert abs(cont.pillar_zero_rates[0] - math.log1p(0.0531 * t) / t) < 1e-16
+        simple = build_yield_curve_from_deposits_simple(val, maturity, (0.0531,), compounding="simple")
+        assert abs(simple.pillar_zero_rates[0] - 0.0531) < 1e-16
+        with pytest.raises(ValueError, match="Discount factors"):
+            build_yield_curve_from_deposits_simple(val, maturity, (-0.01,))
+
     def test_build_from_swaps_single(self) -> None:
         """Test bootstrapping from a single swap."""
         val = date(2024, 1, 1)
@@ -193,6 +356,33 @@ class TestBootstrappingHelpers:
         r = curve.zero_rate(swap_maturity)
         assert 0.015 < r < 0.025  # Should be in reasonable range
 
+    def test_build_from_swaps_reprices_par_swaps(self) -> None:
+        """Test swaps paying on earlier pillars reprice to par on the bootstrapped curve."""
+        from montecarlo_ir.utils.date_helpers import BusinessDayRule, generate_schedule
+
+        val = date(2024, 1, 1)
+        maturities = [date(2024 + n, 1, 1) for n in range(1, 8)]
+        rates = [0.02, 0.022, 0.025, 0.027, 0.028, 0.03, 0.031]
+        curve = build_yield_curve_from_swaps(val, maturities, rates, swap_frequency="1Y")
+        # The first swap is seeded from a simple rate, so check the bootstrapped ones
+        for maturity, rate in zip(maturities[1:], rates[1:]):
+            schedule = generate_schedule(val, maturity, "1Y", BusinessDayRule.NONE)
+            annuity = sum(
+                curve.discount_factor(end) * year_fraction(start, end, curve.day_count)
+                for start, end in zip(schedule, schedule[1:])
+            )
+            assert abs(rate * annuity + curve.discount_factor(maturity) - 1.0) < 1e-14
+
+    def test_build_from_swaps_memoized(self) -> None:
+        """Test identical swap quotes reuse the bootstrapped curve and bumps do not."""
+        val = date(2024, 1, 1)
+        maturities = [date(2025, 1, 1), date(2026, 1, 1), date(2029, 1, 1)]
+        curve = build_yield_curve_from_swaps(val, maturities, [0.02, 0.025, 0.03])
+        assert build_yield_curve_from_swaps(val, tuple(maturities), (0.02, 0.025, 0.03)) is curve
+        bumped = build_yield_curve_from_swaps(val, maturities, [0.02, 0.025, 0.0301])
+        assert bumped is not curve
+        assert bumped.zero_rate(maturities[-1]) > curve.zero_rate(maturities[-1])
+
     def test_build_from_swaps_multiple(self) -> None:
         """Test bootstrapping from multiple swaps."""
         val = date(2024, 1, 1)
@@ -235,4 +425,12 @@ class TestBootstrappingHelpers:
                 par_swap_rates=(0.02, 0.03),
             )
 
+        # Maturity before valuation date
+        with pytest.raises(ValueError, match="must be >= start_date"):
+            build_yield_curve_from_swaps(
+                valuation_date=val,
+                swap_maturities=(date(2023, 6, 1), date(2026, 1, 1)),
+                par_swap_rates=(0.02, 0.03),
+            )
+
 